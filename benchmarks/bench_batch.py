@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+# Batch verify throughput for different worker counts
+# usage: bench_batch.py <save_path> <payload_path> [num_saves]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+save_path = sys.argv[1]
+payload_path = sys.argv[2]
+num_saves = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import actions, batch
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    first_save = os.path.join(temp_dir, 'save0.sav')
+    shutil.copyfile(save_path, first_save)
+    actions.store(first_save, payload_path)
+    for i in range(1, num_saves):
+        shutil.copyfile(first_save, os.path.join(temp_dir, f'save{i}.sav'))
+    jobs = batch.glob_jobs(os.path.join(temp_dir, '*.sav'), 'verify', payload_path)
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1) * 2:
+        start = time.perf_counter()
+        results = list(batch.run_batch(jobs, workers))
+        seconds = time.perf_counter() - start
+        assert all(result['verified'] for result in results)
+        print(f'{workers:3} workers  {len(jobs) / seconds:8.1f} saves/s')
+        workers *= 2
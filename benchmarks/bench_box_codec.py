@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Compares decoding/encoding all box pokemon with and without numpy
+# usage: bench_box_codec.py <save_path> [repeat]
+
+import os
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+with open(save_path, 'rb') as fh:
+    save_data = fh.read()
+
+
+def decode_box():
+    block = model.save(bytearray(save_data)).active_save
+    box_pokemon_data = block.box_data[0x0004:0x8344]
+    start = time.perf_counter()
+    if codec.use_numpy:
+        codec.decode_subdata_batch(box_pokemon_data)
+    else:
+        for i in range(420):
+            model.pokemon(box_pokemon_data[i*80 : (i*80)+80]).egg
+    return time.perf_counter() - start
+
+
+def load_and_read():
+    block = model.save(bytearray(save_data)).active_save
+    for poke in block.pokemon_list:
+        poke.egg
+    return block
+
+
+def edit_and_commit():
+    block = model.save(bytearray(save_data)).active_save
+    for poke in block.pokemon_list:
+        poke.ev_hp = 1
+    block.commit()
+
+
+def best_of(func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+have_numpy = codec.have_numpy()
+codec.use_numpy = False
+per_slot = min(decode_box() for _ in range(repeat))
+codec.use_numpy = have_numpy
+batch = min(decode_box() for _ in range(repeat)) if have_numpy else float('nan')
+print(f'{"decode 420":<15} per slot {per_slot * 1000:8.2f} ms   numpy {batch * 1000:8.2f} ms')
+for label, func in (('load + read', load_and_read), ('edit + commit', edit_and_commit)):
+    codec.use_numpy = False
+    per_slot = best_of(func)
+    codec.use_numpy = have_numpy
+    batch = best_of(func) if have_numpy else float('nan')
+    print(f'{label:<15} per slot {per_slot * 1000:8.2f} ms   numpy {batch * 1000:8.2f} ms')
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+# Sections checksummed per second, for each checksum engine
+# usage: bench_checksum.py <save_path> [repeat]
+
+import os
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+with open(save_path, 'rb') as fh:
+    save_data = bytearray(fh.read())
+sections = []
+for block_start in (0, 0xE000):
+    for i in range(14):
+        start = block_start + i * 0x1000
+        sections.append(model.save_section(save_data[start : start + 0x1000]))
+
+# warm up, numpy is imported on first use
+codec.have_numpy()
+for engine in codec.checksum_engines:
+    codec.checksum_engine = engine
+    assert all(section.valid for section in sections)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for section in sections:
+            section.calculate_checksum()
+    seconds = time.perf_counter() - start
+    print(f'{engine:<8} {len(sections) * repeat / seconds:10.0f} sections/s')
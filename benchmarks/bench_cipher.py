@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Subdata decrypt + encrypt round trips per second for each of the 24 part orders,
+# the original byte at a time functions against the word level ones
+# usage: bench_cipher.py [slots_per_order]
+
+import os
+import random
+import sys
+import time
+
+count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec
+
+
+def original(pid, otid, encrypted):
+    key = (pid ^ otid).to_bytes(4, byteorder='little')
+    order = codec.pokemon_substructure_order_lookup[pid % 24]
+    subdata = codec.make_subdata_organized(order, codec.xor_subdata(key, encrypted))
+    return bytes(codec.xor_subdata(key, codec.make_subdata_messy_again(order, subdata)))
+
+
+def word_level(pid, otid, encrypted):
+    return codec.encrypt_subdata(pid, otid, codec.decrypt_subdata(pid, otid, encrypted))
+
+
+rng = random.Random(0)
+totals = {'original': 0, 'word_level': 0}
+print(f'{"order":<7} {"original":>12} {"word level":>12}  slots/s')
+for order in range(24):
+    # pids with pid % 24 == order
+    slots = [(rng.getrandbits(27) * 24 + order, rng.getrandbits(32), rng.randbytes(48)) for _ in range(count)]
+    rates = []
+    for name, round_trip in (('original', original), ('word_level', word_level)):
+        start = time.perf_counter()
+        for pid, otid, encrypted in slots:
+            assert round_trip(pid, otid, encrypted) == encrypted
+        seconds = time.perf_counter() - start
+        totals[name] += seconds
+        rates.append(count / seconds)
+    print(f'{order:<7} {rates[0]:12.0f} {rates[1]:12.0f}')
+print(f'{"all":<7} {24 * count / totals["original"]:12.0f} {24 * count / totals["word_level"]:12.0f}')
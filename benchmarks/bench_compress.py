@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Compression ratio, bytes per egg and store/extract throughput, for each compression
+# on a text payload (this package's own source), random bytes and a repetitive payload
+# usage: bench_compress.py <save_path>
+
+import glob
+import os
+import random
+import sys
+import time
+
+save_path = sys.argv[1]
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+from pyemeraldsavesteg import model, steg
+
+text = b''.join(open(path, 'rb').read() for path in sorted(glob.glob(os.path.join(root, 'pyemeraldsavesteg', '*.py'))))
+payloads = {
+    'text': text[0:60000],
+    'random': random.Random(0).randbytes(20000),
+    'repeat': b'PyEmeraldSaveSteg ' * 4000,
+}
+
+with open(save_path, 'rb') as fh:
+    save_data = bytearray(fh.read())
+
+print(f'{"payload":<8} {"compression":<12} {"original":>8} {"stored":>8} {"eggs":>5} {"bytes/egg":>9} {"store ms":>9} {"extract ms":>10}')
+for payload_name, payload in payloads.items():
+    for compression in steg.compressions:
+        block = model.save(bytearray(save_data)).active_save
+        start = time.perf_counter()
+        try:
+            stats = block.hide_payload([payload], compression)
+        except ValueError:
+            print(f'{payload_name:<8} {compression:<12} {len(payload):>8} does not fit')
+            continue
+        block.commit()
+        store_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        assert block.extract_secret_data() == payload
+        extract_ms = (time.perf_counter() - start) * 1000
+        print(f'{payload_name:<8} {compression:<12} {stats["original_length"]:>8} {stats["stored_length"]:>8} {stats["eggs"]:>5} {stats["bytes_per_egg"]:>9.1f} {store_ms:>9.1f} {extract_ms:>10.1f}')
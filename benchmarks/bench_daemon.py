@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Latency of answering small questions about a save, one command line run per question vs a running daemon
+# usage: bench_daemon.py <save_path> <payload_path> [queries]
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+save_path = sys.argv[1]
+payload_path = sys.argv[2]
+queries = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+from pyemeraldsavesteg import actions, daemon
+
+
+def percentiles(times):
+    times = sorted(times)
+    return times[len(times) // 2] * 1000, times[min(len(times) - 1, len(times) * 99 // 100)] * 1000
+
+
+def report(label, times):
+    p50, p99 = percentiles(times)
+    print(f'{label:<24} p50 {p50:8.2f} ms  p99 {p99:8.2f} ms')
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    work_save = os.path.join(temp_dir, 'bench.sav')
+    shutil.copyfile(save_path, work_save)
+    actions.store(work_save, payload_path, digest_kind='crc32')
+
+    # the command line starts a new python for every question
+    script = os.path.join(root, 'PyEmeraldSaveSteg.py')
+    cli_queries = max(1, queries // 10)
+    for label, options in (('cli --verify', ['--verify', payload_path]), ('cli --check', ['--check'])):
+        times = []
+        for _ in range(cli_queries):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, script, work_save] + options, check=True, stdout=subprocess.DEVNULL)
+            times.append(time.perf_counter() - start)
+        report(label, times)
+
+    socket_path = os.path.join(temp_dir, 'daemon.sock')
+    server = subprocess.Popen([sys.executable, script, 'daemon', '--socket', socket_path])
+    try:
+        while not os.path.exists(socket_path):
+            time.sleep(0.01)
+        with daemon.client(socket_path=socket_path) as connection:
+            requests = (
+                ('daemon verify', {'operation': 'verify', 'save_path': work_save, 'payload_path': payload_path}),
+                ('daemon check', {'operation': 'check', 'save_path': work_save}),
+                ('daemon extract', {'operation': 'extract', 'save_path': work_save}),
+                ('daemon list_slots box 3', {'operation': 'list_slots', 'save_path': work_save, 'box': 3}),
+            )
+            for label, request in requests:
+                # the first request loads the save, the rest are answered from the cache
+                first = connection.request(**request)
+                assert first['status'] == 'ok', first
+                times = []
+                for _ in range(queries):
+                    start = time.perf_counter()
+                    result = connection.request(**request)
+                    times.append(time.perf_counter() - start)
+                    assert result['status'] == 'ok' and result['cached']
+                report(label, times)
+
+            times = []
+            for _ in range(max(1, queries // 10)):
+                start = time.perf_counter()
+                result = connection.request('store', save_path=work_save, payload_path=payload_path, digest='crc32', delta=True)
+                times.append(time.perf_counter() - start)
+                assert result['status'] == 'ok', result
+            report('daemon store --delta', times)
+            print(f'{"cache":<24} {connection.request("status")}')
+    finally:
+        server.terminate()
+        server.wait()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+
+# Storing a payload again after a small change, rewriting every egg against only the changed ones (delta)
+# usage: bench_delta.py <save_path> <payload_path> [repeat]
+
+import os
+import sys
+import time
+
+save_path = sys.argv[1]
+payload_path = sys.argv[2]
+repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+with open(save_path, 'rb') as fh:
+    save_data = bytearray(fh.read())
+with open(payload_path, 'rb') as fh:
+    payload = bytearray(fh.read())
+
+# the payload as stored before, then changed in two places
+stored = model.save(bytearray(save_data))
+stored.active_save.hide_secret_data(bytearray(payload))
+stored.commit()
+stored_data = stored.get_bytes()
+changed = bytearray(payload)
+changed[100] ^= 0xFF
+changed[len(changed) // 2] ^= 0xFF
+
+codec.use_numpy = False
+for delta in (False, True):
+    seconds = 0
+    for _ in range(repeat):
+        pokemon_save = model.save(bytearray(stored_data))
+        start = time.perf_counter()
+        block = pokemon_save.active_save
+        eggs_written = block.hide_secret_data(bytearray(changed), delta)
+        rewritten = block.commit()
+        seconds += time.perf_counter() - start
+    print(f'{"delta" if delta else "full":<6} {seconds / repeat * 1000:8.2f} ms  {eggs_written} eggs written, {len(rewritten)} sections rewritten')
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Box wide edits (IVs, EVs, moves, item and level of every pokemon that isn't an egg),
+# one property setter at a time vs bulk_edit, both committed
+# usage: bench_edit.py <save_path> [repeat]
+
+import os
+import statistics
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, edit, model
+
+with open(save_path, 'rb') as fh:
+    save_data = fh.read()
+
+changes = {'ivs': [31] * 6, 'evs': [4, 0, 0, 252, 252, 0], 'moves': [33, 45, 0, 0], 'item': 13, 'level': 50}
+
+
+def setters(block, indexes):
+    for i in indexes:
+        this_pokemon = block.pokemon_list[i]
+        this_pokemon.iv_list = changes['ivs']
+        this_pokemon.ev_list = changes['evs']
+        this_pokemon.move_list = changes['moves']
+        this_pokemon.held_item = changes['item']
+        this_pokemon.level = changes['level']
+
+
+def bulk(block, indexes):
+    edit.bulk_edit(block, indexes, **changes)
+
+
+for use_numpy in (False, True):
+    codec.use_numpy = use_numpy
+    if use_numpy and not codec.have_numpy():
+        break
+    results = {}
+    for label, run in (('setters', setters), ('bulk_edit', bulk)):
+        times = []
+        for _ in range(repeat):
+            pokemon_save = model.save(bytearray(save_data))
+            block = pokemon_save.active_save
+            indexes = edit.select_slots(block)
+            start = time.perf_counter()
+            run(block, indexes)
+            pokemon_save.commit()
+            times.append(time.perf_counter() - start)
+        results[label] = bytes(pokemon_save.get_bytes())
+        seconds = statistics.median(times)
+        print(f'{"numpy" if use_numpy else "python":<7} {label:<10} {len(indexes):4} pokemon  {seconds * 1000:7.2f} ms  {len(indexes) / seconds:9.0f} pokemon/s')
+    assert results['setters'] == results['bulk_edit']
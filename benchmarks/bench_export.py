@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+# Exporting every pokemon of many saves, records as json lines and csv vs printing each pokemon
+# usage: bench_export.py <save_path> [num_saves]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+save_path = sys.argv[1]
+num_saves = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import actions, codec, export
+
+codec.use_numpy = False
+
+
+def print_all(save_paths, fh):
+    # what was there before records, str() of every pokemon
+    count = 0
+    for path in save_paths:
+        for this_pokemon in actions.load_save(path).active_save.pokemon_list:
+            if not this_pokemon.is_clear():
+                fh.write(str(this_pokemon) + '\n')
+                count += 1
+    return count
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    save_paths = []
+    for i in range(num_saves):
+        save_paths.append(os.path.join(temp_dir, f'save{i}.sav'))
+        shutil.copyfile(save_path, save_paths[-1])
+
+    runs = (
+        ('str()', lambda fh: print_all(save_paths, fh)),
+        ('jsonl', lambda fh: export.write_records(export.iter_saves(save_paths), fh, 'jsonl')),
+        ('csv', lambda fh: export.write_records(export.iter_saves(save_paths), fh, 'csv')),
+    )
+    for label, run in runs:
+        with open(os.devnull, 'w') as fh:
+            start = time.perf_counter()
+            count = run(fh)
+            seconds = time.perf_counter() - start
+        # memory shouldn't grow with the number of saves
+        tracemalloc.start()
+        with open(os.devnull, 'w') as fh:
+            run(fh)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f'{label:<6} {count / seconds:9.0f} records/s  {num_saves / seconds:7.1f} saves/s  peak {peak / 1024:7.0f} KiB')
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Cold import time and per operation latency, for the library and the command line
+# usage: bench_import.py <save_path> <payload_path> [repeat]
+
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# absolute, the command line runs from the repo directory
+save_path = os.path.abspath(sys.argv[1])
+payload_path = os.path.abspath(sys.argv[2])
+repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+repo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, repo_dir)
+script = os.path.join(repo_dir, 'PyEmeraldSaveSteg.py')
+
+
+def median_run(command):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL, cwd=repo_dir)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def median_call(func):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    work_save = os.path.join(temp_dir, 'bench.sav')
+    shutil.copyfile(save_path, work_save)
+    subprocess.run([sys.executable, script, work_save, '--store', payload_path], check=True, cwd=repo_dir)
+
+    interpreter = median_run([sys.executable, '-c', 'pass'])
+    cold_import = median_run([sys.executable, '-c', 'import pyemeraldsavesteg'])
+    cli_verify = median_run([sys.executable, script, work_save, '--verify', payload_path])
+
+    import pyemeraldsavesteg
+
+    with open(payload_path, 'rb') as fh:
+        payload = bytearray(fh.read())
+
+    def verify():
+        with open(work_save, 'rb') as fh:
+            pokemon_save = pyemeraldsavesteg.save(bytearray(fh.read()))
+        assert pokemon_save.active_save.verify_secret_data(payload)
+
+    library_verify = median_call(verify)
+
+print(f'interpreter startup      {interpreter * 1000:8.1f} ms')
+print(f'cold import (library)    {(cold_import - interpreter) * 1000:8.1f} ms')
+print(f'verify via command line  {cli_verify * 1000:8.1f} ms')
+print(f'verify via library       {library_verify * 1000:8.1f} ms')
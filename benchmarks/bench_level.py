@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Level, exp type and exp to next level for every pokemon in the boxes, and changing species (which keeps the level)
+# usage: bench_level.py <save_path> [repeat]
+
+import os
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import model
+
+with open(save_path, 'rb') as fh:
+    save_data = bytearray(fh.read())
+block = model.save(save_data).active_save
+# eggs used for hiding data can have any species, only time the real pokemon
+pokemon_list = [p for p in block.pokemon_list if not p.is_clear() and 0 < p.national_dex_id <= 386]
+
+start = time.perf_counter()
+for _ in range(repeat):
+    levels = [p.level for p in pokemon_list]
+seconds = time.perf_counter() - start
+print(f'level            {len(pokemon_list) * repeat / seconds:10.0f} pokemon/s')
+
+start = time.perf_counter()
+for _ in range(repeat):
+    exp_types = [p.exp_type for p in pokemon_list]
+seconds = time.perf_counter() - start
+print(f'exp_type         {len(pokemon_list) * repeat / seconds:10.0f} pokemon/s')
+
+start = time.perf_counter()
+for _ in range(repeat):
+    for p in pokemon_list:
+        p.national_dex_id = p.national_dex_id % 386 + 1
+seconds = time.perf_counter() - start
+print(f'national_dex_id= {len(pokemon_list) * repeat / seconds:10.0f} pokemon/s')
+print(f'{len(pokemon_list)} pokemon, level sum {sum(levels)}')
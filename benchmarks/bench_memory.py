@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+# Memory held by an open save and the time it takes to load, read into memory vs memory mapped
+# usage: bench_memory.py <save_path> [repeat]
+
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+# numpy would only add its own allocations to the numbers
+codec.use_numpy = False
+
+
+def load_bytearray(path):
+    with open(path, 'rb') as fh:
+        return model.save(bytearray(fh.read()))
+
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    work_save = os.path.join(temp_dir, 'bench.sav')
+    shutil.copyfile(save_path, work_save)
+
+    for label, load in (('bytearray', load_bytearray), ('mmap', model.mmap_save)):
+        tracemalloc.start()
+        pokemon_save = load(work_save)
+        pokemon_save.active_save
+        held, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        pokemon_save.close()
+
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            pokemon_save = load(work_save)
+            pokemon_save.active_save
+            times.append(time.perf_counter() - start)
+            pokemon_save.close()
+        print(f'{label:<10} held {held / 1024:6.0f} KiB  peak {peak / 1024:6.0f} KiB  load {statistics.median(times) * 1000:6.2f} ms')
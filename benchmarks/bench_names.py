@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+# Reading all 420 names, one pokemon at a time against save_block.names(), and writing a 4200 character text over them
+# usage: bench_names.py <save_path> [repeat]
+
+import os
+import random
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+with open(save_path, 'rb') as fh:
+    save_data = bytearray(fh.read())
+block = model.save(save_data).active_save
+text = ''.join(random.Random(0).choice(codec.text_chars) for _ in range(4200))
+
+start = time.perf_counter()
+for _ in range(repeat):
+    names = [p.name for p in block.pokemon_list]
+seconds = time.perf_counter() - start
+print(f'name per pokemon   {seconds / repeat * 1000:8.3f} ms per box')
+
+start = time.perf_counter()
+for _ in range(repeat):
+    assert block.names() == names
+seconds = time.perf_counter() - start
+print(f'names()            {seconds / repeat * 1000:8.3f} ms per box')
+
+start = time.perf_counter()
+for _ in range(repeat):
+    block.string_to_names(text)
+seconds = time.perf_counter() - start
+print(f'string_to_names    {seconds / repeat * 1000:8.3f} ms per 4200 characters')
+assert ''.join(block.names()) == text
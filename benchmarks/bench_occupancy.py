@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# Slot occupancy vs decrypting every pokemon to find the eggs, and storing and extracting with a placement,
+# contiguous and scattered, before and after the eggs are shuffled around the boxes
+# usage: bench_occupancy.py <save_path> <payload_path> [repeat]
+
+import os
+import random
+import statistics
+import sys
+import time
+
+save_path = sys.argv[1]
+payload_path = sys.argv[2]
+repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model, steg
+
+codec.use_numpy = False
+
+with open(save_path, 'rb') as fh:
+    save_data = fh.read()
+with open(payload_path, 'rb') as fh:
+    payload = fh.read()
+
+
+def median_ms(data, run):
+    # run gets the active block of a freshly loaded copy of data, loading isn't timed
+    times = []
+    for _ in range(repeat):
+        block = model.save(bytearray(data)).active_save
+        start = time.perf_counter()
+        run(block)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def extract(block):
+    assert b''.join(steg.iter_payload(block, steg.read_payload_header(block))) == payload
+
+
+def shuffled(data, slots):
+    # the same eggs, moved to each other's cells
+    pokemon_save = model.save(bytearray(data))
+    block = pokemon_save.active_save
+    eggs = [bytes(block.pokemon_list[i].bytes_) for i in slots]
+    random.Random(0).shuffle(eggs)
+    for i, egg in zip(slots, eggs):
+        block.box_data[0x0004 + (i * 80) : 0x0004 + (i * 80) + 80] = egg
+        block.mark_box_data_dirty(0x0004 + (i * 80), 0x0004 + (i * 80) + 80)
+    pokemon_save.commit()
+    return bytes(pokemon_save.get_bytes())
+
+
+occupancy = model.save(bytearray(save_data)).active_save.occupancy
+print(f'{occupancy.count(model.slot_empty)} empty cells, {occupancy.count(model.slot_egg)} eggs, {occupancy.count(model.slot_pokemon)} pokemon')
+print(f'egg_slots() {median_ms(save_data, lambda block: block.egg_slots()):7.2f} ms')
+print(f'decrypting  {median_ms(save_data, lambda block: [i for i, poke in enumerate(block.pokemon_list) if not poke.is_clear() and poke.egg & 1]):7.2f} ms')
+print(f'capacity    {419 * steg.bytes_per_poke} bytes with a header, {419 * steg.sequence_chunk_size} in sequenced eggs, {(occupancy.count(model.slot_empty) - 1) * steg.sequence_chunk_size} in the empty cells')
+print()
+
+print(f'{"store":<22} {"eggs":>5} {"store ms":>9} {"extract ms":>11} {"shuffled ms":>12}')
+runs = (
+    ('hide_payload', lambda block: block.hide_payload([payload], 'none')),
+    ('contiguous', lambda block: block.hide_placed([payload], empty_only=False)),
+    ('contiguous empty_only', lambda block: block.hide_placed([payload])),
+    ('scattered', lambda block: block.hide_placed([payload], empty_only=False, layout='scattered')),
+    ('scattered empty_only', lambda block: block.hide_placed([payload], layout='scattered')),
+)
+for label, store in runs:
+    try:
+        store_ms = median_ms(save_data, store)
+    except ValueError as e:
+        print(f'{label:<22} {e}')
+        continue
+    pokemon_save = model.save(bytearray(save_data))
+    store_stats = store(pokemon_save.active_save)
+    pokemon_save.commit()
+    stored_data = bytes(pokemon_save.get_bytes())
+    extract_ms = median_ms(stored_data, extract)
+
+    shuffled_ms = float('nan')
+    if 'slots' in store_stats:
+        shuffled_ms = median_ms(shuffled(stored_data, store_stats['slots']), extract)
+    print(f'{label:<22} {store_stats["eggs"]:5} {store_ms:9.2f} {extract_ms:11.2f} {shuffled_ms:12.2f}')
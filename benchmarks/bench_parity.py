@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Parity eggs, the capacity they cost and the time they add to storing and extracting,
+# including extracting with one damaged egg in every group
+# usage: bench_parity.py <save_path> <payload_path> [repeat]
+
+import math
+import os
+import statistics
+import sys
+import time
+
+save_path = sys.argv[1]
+payload_path = sys.argv[2]
+repeat = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model, steg
+
+codec.use_numpy = False
+
+with open(save_path, 'rb') as fh:
+    save_data = fh.read()
+with open(payload_path, 'rb') as fh:
+    payload = fh.read()
+
+
+def capacity(parity):
+    # bytes that fit in the 419 eggs after the header
+    if not parity:
+        return 419 * steg.bytes_per_poke
+    data_eggs = 419 * parity // (parity + 1)
+    while data_eggs + math.ceil(data_eggs / parity) > 419:
+        data_eggs -= 1
+    return data_eggs * steg.parity_chunk_size
+
+
+def median_ms(data, run):
+    # run gets the active block of a freshly loaded copy of data, loading isn't timed
+    times = []
+    for _ in range(repeat):
+        block = model.save(bytearray(data)).active_save
+        start = time.perf_counter()
+        run(block)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def extract(block):
+    assert b''.join(steg.iter_payload(block, steg.read_payload_header(block))) == payload
+
+
+def damage(block, parity):
+    # clears the first data egg of every group
+    pokemon_index = len(block.pokemon_list) - 2
+    eggs = steg.read_payload_header(block).stored_length / steg.parity_chunk_size
+    for _ in range(math.ceil(eggs / parity)):
+        block.pokemon_list[pokemon_index].clear()
+        pokemon_index -= parity + 1
+
+
+print(f'{"parity":<7} {"capacity":>9} {"eggs":>5} {"store ms":>9} {"extract ms":>11} {"damaged ms":>11}')
+for parity in (0, 4, 8, 16, 32, 64):
+    if len(payload) > capacity(parity):
+        print(f'{parity:<7} {capacity(parity):9}  payload too big')
+        continue
+    store = lambda block: block.hide_payload([payload], 'none', digest_kind='crc32', parity=parity)
+    store_ms = median_ms(save_data, store)
+
+    pokemon_save = model.save(bytearray(save_data))
+    eggs = store(pokemon_save.active_save)['eggs']
+    pokemon_save.commit()
+    stored_data = bytes(pokemon_save.get_bytes())
+    extract_ms = median_ms(stored_data, extract)
+
+    damaged_ms = float('nan')
+    if parity:
+        pokemon_save = model.save(bytearray(stored_data))
+        damage(pokemon_save.active_save, parity)
+        pokemon_save.commit()
+        damaged_ms = median_ms(bytes(pokemon_save.get_bytes()), extract)
+    print(f'{parity:<7} {capacity(parity):9} {eggs:5} {store_ms:9.2f} {extract_ms:11.2f} {damaged_ms:11.2f}')
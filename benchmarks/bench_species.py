@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# National ids of every pokemon in the boxes, one pokemon at a time against save_block.species_ids(), with and without numpy
+# usage: bench_species.py <save_path> [repeat]
+
+import os
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+with open(save_path, 'rb') as fh:
+    save_data = bytearray(fh.read())
+
+def one_at_a_time(block):
+    national_ids = []
+    for p in block.pokemon_list:
+        try:
+            national_ids.append(p.national_dex_id)
+        except IndexError:
+            national_ids.append(0)
+    return national_ids
+
+# warm up, numpy is imported on first use
+codec.have_numpy()
+expected = None
+for name, use_numpy, species in (('per pokemon', False, one_at_a_time),
+                                 ('species_ids', False, model.save_block.species_ids),
+                                 ('species_ids numpy', True, model.save_block.species_ids)):
+    codec.use_numpy = use_numpy
+    seconds = 0
+    for _ in range(repeat):
+        # a fresh save each time, so nothing is decrypted yet
+        block = model.save(bytearray(save_data)).active_save
+        start = time.perf_counter()
+        national_ids = species(block)
+        seconds += time.perf_counter() - start
+    expected = expected or national_ids
+    assert national_ids == expected
+    print(f'{name:<18} {seconds / repeat * 1000:8.2f} ms per box')
+
+print(f'{len(block.species_histogram())} species, most common: {sorted(block.species_histogram().items(), key=lambda x: -x[1])[0:3]}')
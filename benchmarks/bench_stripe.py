@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+
+# Striped store/extract throughput for different numbers of saves
+# usage: bench_stripe.py <save_path> [max_saves]
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+save_path = sys.argv[1]
+max_saves = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import stripe
+
+with tempfile.TemporaryDirectory() as temp_dir:
+    count = 1
+    while count <= max_saves:
+        save_paths = []
+        for i in range(count):
+            save_paths.append(os.path.join(temp_dir, f'save{i}.sav'))
+            shutil.copyfile(save_path, save_paths[-1])
+        payload = os.urandom(count * stripe.stripe_capacity)
+
+        start = time.perf_counter()
+        stripe.store_striped(payload, save_paths)
+        store_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert stripe.extract_striped(list(reversed(save_paths))) == payload
+        extract_seconds = time.perf_counter() - start
+
+        kib = len(payload) / 1024
+        print(f'{count:3} saves  store {kib / store_seconds:8.1f} KiB/s  extract {kib / extract_seconds:8.1f} KiB/s')
+        count *= 2
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Times reading and editing every box slot of a save
+# usage: bench_subdata.py <save_path> [repeat]
+
+import os
+import sys
+import time
+
+save_path = sys.argv[1]
+repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+import pyemeraldsavesteg as steg
+
+
+def load():
+    with open(save_path, 'rb') as fh:
+        return steg.save(bytearray(fh.read()))
+
+
+def read_all(block):
+    for poke in block.pokemon_list:
+        str(poke)
+
+
+def edit_all(block):
+    for poke in block.pokemon_list:
+        if poke.is_clear():
+            continue
+        poke.ev_list = [1, 2, 3, 4, 5, 6]
+        poke.move_list = [1, 2, 3, 4]
+        poke.held_item = 13
+
+
+def best_of(func):
+    times = []
+    for _ in range(repeat):
+        block = load().active_save
+        start = time.perf_counter()
+        func(block)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def edit_and_commit(block):
+    edit_all(block)
+    block.commit()
+
+
+slots = len(load().active_save.pokemon_list)
+for label, func in (('str() every slot', read_all), ('edit every slot', edit_all), ('edit + commit', edit_and_commit)):
+    seconds = best_of(func)
+    print(f'{label:<20} {seconds * 1000:8.2f} ms  {slots / seconds:10.0f} slots/s')
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+
+# Times the main operations on a save and writes the results as JSON, so runs on different versions can be diffed
+# uses a synthetic save from make_save.py unless a save is given
+# usage: bench_suite.py [--save save_path] [--seed N] [--repeat N] [--output results.json] [--compare old_results.json]
+
+import argparse
+import inspect
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, root)
+from pyemeraldsavesteg import codec, model
+from make_save import make_save
+
+
+def time_it(function, repeat, setup=None):
+    # median seconds of repeat runs, setup's result is passed to function and isn't timed
+    times = []
+    for _ in range(repeat):
+        argument = setup() if setup else None
+        start = time.perf_counter()
+        function(argument)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def pokemon_properties():
+    # every public property of pokemon, and whether it can be set
+    properties = []
+    for name, value in inspect.getmembers(model.pokemon):
+        if isinstance(value, property) and not name.startswith('_') and name != 'bytes_':
+            properties.append((name, value.fset is not None))
+    return properties
+
+
+def run(save_data, repeat):
+    results = {}
+    payload = bytearray(random.Random(0).randbytes(20000))
+    text = ''.join(random.Random(0).choice(codec.text_chars) for _ in range(4200))
+
+    def fresh_save(_=None):
+        return model.save(bytearray(save_data))
+
+    def fresh_block():
+        return fresh_save().active_save
+
+    def stored_block():
+        block = fresh_block()
+        block.hide_secret_data(bytearray(payload))
+        return block
+
+    def edited_block():
+        block = fresh_block()
+        for this_pokemon in block.pokemon_list[0:30]:
+            this_pokemon.name = 'EDITED'
+        return block
+
+    results['load'] = time_it(fresh_save, repeat)
+    results['active_save'] = time_it(lambda pokemon_save: pokemon_save.active_save, repeat, fresh_save)
+
+    # getters and setters, per pokemon, on every pokemon in the boxes
+    block = fresh_block()
+    pokemon_list = [p for p in block.pokemon_list if not p.is_clear()]
+    for name, settable in pokemon_properties():
+        getter_seconds = time_it(lambda _: [getattr(p, name) for p in pokemon_list], repeat)
+        results[f'pokemon.{name}'] = getter_seconds / len(pokemon_list)
+        if settable:
+            values = [getattr(p, name) for p in pokemon_list]
+            def set_all(_):
+                for p, value in zip(pokemon_list, values):
+                    setattr(p, name, value)
+            results[f'pokemon.{name}='] = time_it(set_all, repeat) / len(pokemon_list)
+
+    results['hide_secret_data'] = time_it(lambda block: block.hide_secret_data(bytearray(payload)), repeat, fresh_block)
+    results['extract_secret_data'] = time_it(lambda block: block.extract_secret_data(), repeat, stored_block)
+    results['verify_secret_data'] = time_it(lambda block: block.verify_secret_data(bytearray(payload)), repeat, stored_block)
+    results['string_to_names'] = time_it(lambda block: block.string_to_names(text), repeat, fresh_block)
+    results['commit'] = time_it(lambda block: block.commit(), repeat, edited_block)
+    results['commit all'] = time_it(lambda block: block.commit(), repeat, stored_block)
+    return results
+
+
+def version():
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=root, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return ''
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--save', help='Save to use, instead of a synthetic one')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for the synthetic save')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--no-numpy', action='store_true', help='Time without numpy, even if it is installed')
+    parser.add_argument('--output', '-o', help='Write the JSON results here, instead of stdout')
+    parser.add_argument('--compare', help='JSON results from an earlier run, prints how each time changed')
+    args = parser.parse_args()
+
+    if args.save:
+        with open(args.save, 'rb') as fh:
+            save_data = fh.read()
+    else:
+        save_data = bytes(make_save(args.seed))
+    codec.use_numpy = not args.no_numpy
+    # numpy (if used) is imported before timing anything
+    codec.have_numpy()
+
+    report = {
+        'version': version(),
+        'python': platform.python_version(),
+        'numpy': codec.have_numpy(),
+        'save': args.save or f'synthetic seed {args.seed}',
+        'repeat': args.repeat,
+        # median seconds, per pokemon for the pokemon properties
+        'seconds': run(save_data, args.repeat),
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as fh:
+            fh.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as fh:
+            old_seconds = json.load(fh)['seconds']
+        for name, seconds in report['seconds'].items():
+            if name in old_seconds:
+                print(f'{name:<32} {old_seconds[name] * 1e6:12.2f} us {seconds * 1e6:12.2f} us  {old_seconds[name] / seconds:6.2f}x', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
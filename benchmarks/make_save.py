@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# Makes a valid synthetic save, so benchmarks don't need a real one
+# both blocks have their 14 sections (rotated by save index like the game does), save indexes and checksums,
+# and the boxes are filled with random pokemon and eggs
+# usage: make_save.py <save_path> [seed] [fill]
+# fill is the share of box cells that aren't empty, a third of those are eggs
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from pyemeraldsavesteg import codec, model
+
+section_signature = 0x08012025
+
+
+def make_pokemon(rng, egg):
+    this_pokemon = model.pokemon(bytearray(80))
+    this_pokemon.pid = rng.getrandbits(32)
+    this_pokemon.otid = rng.getrandbits(32)
+    this_pokemon.national_dex_id = rng.randint(1, 386)
+    this_pokemon.level = rng.randint(1, 100)
+    this_pokemon.held_item = rng.choice([0, 0, 0, 13, 200])
+    this_pokemon.move_list = [rng.randint(1, 354) for _ in range(4)]
+    this_pokemon.ev_list = [rng.randint(0, 85) for _ in range(6)]
+    this_pokemon.name = ''.join(rng.choice(codec.text_chars[0:52]) for _ in range(rng.randint(3, 10)))
+    this_pokemon.egg = egg
+    this_pokemon.flush()
+    return this_pokemon.bytes_
+
+
+def make_block(rng, save_index, box_data):
+    sections = []
+    box_position = 0
+    for section_id, size in enumerate(model.section_size_lookup):
+        section_bytes = bytearray(0x1000)
+        if section_id >= 5:
+            section_bytes[0:size] = box_data[box_position : box_position+size]
+            box_position += size
+        else:
+            # trainer, bag, flags and so on, not read by this package
+            section_bytes[0:size] = rng.randbytes(size)
+        section_bytes[0xff4:0xff6] = section_id.to_bytes(2, byteorder='little')
+        section_bytes[0xff8:0xffc] = section_signature.to_bytes(4, byteorder='little')
+        section_bytes[0xffc:0x1000] = save_index.to_bytes(4, byteorder='little')
+        model.save_section(section_bytes).fix_checksum()
+        sections.append(section_bytes)
+    rotation = save_index % 14
+    return b''.join(sections[rotation:] + sections[:rotation])
+
+
+def make_save(seed=0, fill=0.6):
+    rng = random.Random(seed)
+    box_data = bytearray(33744)
+    # current box
+    box_data[0:4] = (0).to_bytes(4, byteorder='little')
+    for i in range(420):
+        x = rng.random()
+        if x < fill:
+            start = 0x0004 + (i * 80)
+            box_data[start : start+80] = make_pokemon(rng, x < fill / 3)
+    # box names and wallpapers
+    box_data[0x8344:] = rng.randbytes(33744 - 0x8344)
+
+    # the newer block is the active one
+    save_index = rng.randint(100, 10000)
+    save_data = bytearray(make_block(rng, save_index, box_data) + make_block(rng, save_index - 1, box_data))
+    # hall of fame, mystery gift, recorded battle
+    save_data.extend(rng.randbytes(0x20000 - 0x1C000))
+    return save_data
+
+
+if __name__ == '__main__':
+    save_data = make_save(int(sys.argv[2]) if len(sys.argv) > 2 else 0, float(sys.argv[3]) if len(sys.argv) > 3 else 0.6)
+    with open(sys.argv[1], 'wb') as fh:
+        fh.write(save_data)
@@ -0,0 +1,15 @@
+# 2021 - jtm.gg
+# Version 0.9
+
+# the command line lives in pyemeraldsavesteg.cli, it isn't imported here
+# so that using the library doesn't pay for argparse
+
+from .model import ExpType, pokemon, save, save_block, save_section
+
+
+def __getattr__(name):
+    # these tables are big, so they are only loaded when first used
+    if name in ('item_list', 'PokemonName'):
+        from . import data
+        return getattr(data, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,161 @@
+# the command line actions, working on save files
+# used by the command line, and by batch mode where each of these runs in a worker process
+
+import base64
+import binascii
+import math
+import os
+import sys
+
+from . import stats, steg
+from .model import save
+
+# payloads are read this much at a time when compressing
+read_size = 64 * 1024
+
+
+def load_save(save_path):
+    with stats.phase('read'):
+        with open(save_path, 'rb') as fh:
+            save_data = bytearray(fh.read())
+            if len(save_data) != 131072:
+                raise ValueError('Save data is the wrong size.')
+    with stats.phase('parse'):
+        return save(save_data)
+
+
+def write_save(save_path, pokemon_save):
+    with stats.phase('commit'):
+        pokemon_save.commit()
+    with stats.phase('write'):
+        with open(save_path, 'wb') as fh:
+            fh.write(pokemon_save.get_bytes())
+
+
+def select_save(pokemon_save, use_backup_save=False):
+    with stats.phase('active_save'):
+        if use_backup_save:
+            return pokemon_save.backup_save
+        return pokemon_save.active_save
+
+
+def text_to_b64_names(save_path, text, use_backup_save=False):
+    pokemon_save = load_save(save_path)
+    b64_bytes = base64.standard_b64encode(bytes(text, 'utf-8'))
+    b64_string = b64_bytes.decode('utf-8')
+    select_save(pokemon_save, use_backup_save).string_to_names(b64_string)
+    write_save(save_path, pokemon_save)
+
+
+def b64_names_to_text(save_path, output_path, num_bytes=None, use_backup_save=False):
+    # the reverse of text_to_b64_names, output_path '-' writes to stdout
+    pokemon_save = load_save(save_path)
+    b64_string = select_save(pokemon_save, use_backup_save).names_to_string()
+    try:
+        text_bytes = base64.standard_b64decode(b64_string)
+    except binascii.Error as e:
+        raise ValueError(f'The names don\'t hold Base64 text: {e}')
+    if num_bytes:
+        text_bytes = text_bytes[0:int(num_bytes)]
+    if output_path == '-':
+        sys.stdout.buffer.write(text_bytes)
+        sys.stdout.buffer.flush()
+    else:
+        with open(output_path, 'wb') as fh:
+            fh.write(text_bytes)
+    return len(text_bytes)
+
+
+def store(save_path, payload_path, use_backup_save=False, compression=None, level=None, digest_kind=None, delta=False, parity=0, placement=None):
+    # returns a dict of how much was stored, see store_in_block
+    pokemon_save = load_save(save_path)
+    store_stats = store_in_block(select_save(pokemon_save, use_backup_save), payload_path, compression, level, digest_kind, delta, parity, placement)
+    write_save(save_path, pokemon_save)
+    return store_stats
+
+
+def store_in_block(block, payload_path, compression=None, level=None, digest_kind=None, delta=False, parity=0, placement=None):
+    # with a compression (or 'none'), a digest or parity the payload is stored with a header, see steg.hide_payload
+    # with placement, a dict of empty_only, boxes and layout, it is stored in sequenced eggs, see steg.hide_placed
+    # with delta only the eggs whose chunk changed are rewritten
+    # the block isn't committed, so this can be used on a save that is already open
+    if placement is not None:
+        if parity:
+            raise ValueError('Parity can\'t be used with a placement')
+        with open(payload_path, 'rb') as fh:
+            data_pieces = iter(lambda: fh.read(read_size), b'')
+            return block.hide_placed(data_pieces, compression or 'none', level, digest_kind or 'crc32', delta, **placement)
+
+    if compression or digest_kind or parity:
+        with open(payload_path, 'rb') as fh:
+            data_pieces = iter(lambda: fh.read(read_size), b'')
+            return block.hide_payload(data_pieces, compression or 'none', level, digest_kind or 'crc32', delta, parity)
+
+    with open(payload_path, 'rb') as fh:
+        secret_data = bytearray(fh.read())
+    eggs_written = block.hide_secret_data(secret_data, delta)
+    return {'eggs': math.ceil(len(secret_data)/steg.bytes_per_poke), 'eggs_written': eggs_written}
+
+
+def store_data(save_path, secret_data, use_backup_save=False, delta=False):
+    # returns how many eggs were written
+    pokemon_save = load_save(save_path)
+    eggs_written = select_save(pokemon_save, use_backup_save).hide_secret_data(bytearray(secret_data), delta)
+    write_save(save_path, pokemon_save)
+    return eggs_written
+
+
+def extract(save_path, output_path, num_bytes=None, use_backup_save=False):
+    pokemon_save = load_save(save_path)
+    block = select_save(pokemon_save, use_backup_save)
+    info = steg.read_payload_header(block)
+    if info is not None:
+        # the header knows the exact length, so num_bytes isn't needed, the data is decompressed as it is written out
+        # the length and digest are only checked at the end, so it goes to a temporary file renamed once they pass
+        temp_path = output_path + '.part'
+        try:
+            with open(temp_path, 'wb') as fh:
+                for data in steg.iter_payload(block, info):
+                    fh.write(data)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        os.replace(temp_path, output_path)
+        return
+
+    secret_data = block.extract_secret_data()
+    if num_bytes:
+        secret_data = secret_data[0:int(num_bytes)]
+    with open(output_path, 'wb') as fh:
+        fh.write(secret_data)
+
+
+def extract_data(save_path, use_backup_save=False):
+    pokemon_save = load_save(save_path)
+    return select_save(pokemon_save, use_backup_save).extract_secret_data()
+
+
+def verify(save_path, payload_path, use_backup_save=False):
+    pokemon_save = load_save(save_path)
+    with open(payload_path, 'rb') as fh:
+        secret_data = bytearray(fh.read())
+    return select_save(pokemon_save, use_backup_save).verify_secret_data(secret_data)
+
+
+def check(save_path, use_backup_save=False):
+    # True or False for data stored with a header, None if there isn't one,
+    # and how many eggs need rewriting with repair() (damaged, but rebuilt from their parity group)
+    pokemon_save = load_save(save_path)
+    repairs = []
+    success = select_save(pokemon_save, use_backup_save).check_payload(repairs)
+    return success, len(repairs)
+
+
+def repair(save_path, use_backup_save=False):
+    # rewrites damaged eggs of data stored with parity eggs, the save is only written if any were
+    # returns how many eggs were rewritten, None if there is no header
+    pokemon_save = load_save(save_path)
+    repaired = select_save(pokemon_save, use_backup_save).repair_payload()
+    if repaired:
+        write_save(save_path, pokemon_save)
+    return repaired
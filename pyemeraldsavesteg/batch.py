@@ -0,0 +1,118 @@
+# batch mode, runs store/extract/verify over many saves using a pool of worker processes
+#
+#   PyEmeraldSaveSteg.py batch --manifest jobs.csv [--workers N]
+#   PyEmeraldSaveSteg.py batch --glob 'saves/*.sav' --operation verify --payload secret.bin [--workers N]
+#
+# a manifest is a csv file with one job per row: save_path,operation,payload_path
+# for extract the payload path is where the data is written, with --glob it is a directory
+# one json line is printed per save, a save that fails doesn't stop the others
+# jobs run in parallel, so a save shouldn't be stored to by more than one row
+
+import argparse
+import contextlib
+import csv
+import io
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from . import actions
+
+operations = ('store', 'extract', 'verify')
+
+
+def read_manifest(manifest_path):
+    jobs = []
+    with open(manifest_path, newline='') as fh:
+        for row in csv.reader(fh):
+            if not row or row[0].startswith('#'):
+                continue
+            if len(row) != 3:
+                raise ValueError(f'Manifest rows need save_path,operation,payload_path: {row}')
+            jobs.append(tuple(field.strip() for field in row))
+    return jobs
+
+
+def glob_jobs(pattern, operation, payload_path):
+    # for extract, each output is named after the save's path from the directory all the saves are in,
+    # saves/a/emerald.sav and saves/b/emerald.sav go to a_emerald.bin and b_emerald.bin
+    save_paths = sorted(glob.glob(pattern))
+    if operation != 'extract':
+        return [(save_path, operation, payload_path) for save_path in save_paths]
+    jobs = []
+    outputs = {}
+    top = os.path.commonpath([os.path.dirname(os.path.abspath(save_path)) for save_path in save_paths]) if save_paths else ''
+    for save_path in save_paths:
+        name = os.path.splitext(os.path.relpath(os.path.abspath(save_path), top))[0].replace(os.sep, '_')
+        if name in outputs:
+            raise ValueError(f'{save_path} and {outputs[name]} would both extract to {name}.bin')
+        outputs[name] = save_path
+        jobs.append((save_path, operation, os.path.join(payload_path, name + '.bin')))
+    return jobs
+
+
+def run_job(job, use_backup_save=False):
+    save_path, operation, payload_path = job
+    result = {'save_path': save_path, 'operation': operation, 'payload_path': payload_path}
+    # the model prints some warnings, they go in the result instead of between the json lines
+    output = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            if operation == 'store':
+                actions.store(save_path, payload_path, use_backup_save)
+            elif operation == 'extract':
+                actions.extract(save_path, payload_path, use_backup_save=use_backup_save)
+            elif operation == 'verify':
+                result['verified'] = actions.verify(save_path, payload_path, use_backup_save)
+            else:
+                raise ValueError(f'Unknown operation: {operation}')
+        result['status'] = 'ok'
+    except Exception as e:
+        result['status'] = 'error'
+        result['error'] = f'{type(e).__name__}: {e}'
+    result['seconds'] = round(time.perf_counter() - start, 6)
+    if output.getvalue():
+        result['output'] = output.getvalue()
+    return result
+
+
+def run_batch(jobs, workers=None, use_backup_save=False):
+    # yields one result dict per job, in the same order as jobs
+    # jobs are sent to the workers in chunks, so thousands of small saves don't mean thousands of round trips
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, min(32, len(jobs) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(run_job, jobs, [use_backup_save] * len(jobs), chunksize=chunksize)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='PyEmeraldSaveSteg.py batch')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--manifest', '-m', help='CSV file, one save_path,operation,payload_path per row')
+    source.add_argument('--glob', '-g', help='Pattern matching the saves to use, e.g. saves/*.sav')
+    parser.add_argument('--operation', '-o', choices=operations, help='Operation to run on each save, with --glob')
+    parser.add_argument('--payload', '-p', help='Payload file to store/verify, or directory to extract to, with --glob')
+    parser.add_argument('--workers', '-w', type=int, help='Number of worker processes, defaults to the number of CPUs')
+    parser.add_argument('--use-backup-save', '-b', help='Use the backup save (not the current save)', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.manifest:
+        jobs = read_manifest(args.manifest)
+    else:
+        if not (args.operation and args.payload):
+            parser.error('--glob needs --operation and --payload')
+        try:
+            jobs = glob_jobs(args.glob, args.operation, args.payload)
+        except ValueError as e:
+            parser.error(str(e))
+
+    for result in run_batch(jobs, args.workers, args.use_backup_save):
+        print(json.dumps(result), flush=True)
@@ -0,0 +1,162 @@
+# command line interface, see main()
+# `batch`, `stripe`, `daemon`, `export` or `edit` as the first argument runs that mode instead, see the module of the same name
+
+import argparse
+import json
+import sys
+
+from . import actions, codec, edit, stats, steg
+
+
+def build_parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('save_path', help='Filepath to save, used for reading and writing (good idea to make a backup first)')
+    parser.add_argument('--use-backup-save', '-b', help='Use the backup save (not the current save)', action='store_true')
+    parser.add_argument('--num-bytes-extract', '-n', help='Exact number of bytes to extract. End of data is (usually) padded with empty/null/0x0 bytes, use this to trim the secret data when saving secret data to a file')
+    parser.add_argument('--checksum-engine', choices=sorted(codec.checksum_engines), default=codec.checksum_engine, help='How section checksums are calculated, "check" compares the fast engine against the original one')
+    parser.add_argument('--compress', choices=steg.compressions, help='Compress the file being stored, and store it with a header so extracting needs no --num-bytes-extract ("none" only adds the header)')
+    parser.add_argument('--compress-level', type=int, help='Compression level, zlib 0-9, lzma 0-9, bz2 1-9 (default is each one\'s own default), lzma\'s extreme presets aren\'t supported')
+    parser.add_argument('--digest', choices=steg.digests, help='Store the file with a header holding its length and this digest (crc32 is the default with --compress), so --check can validate it without the original file')
+    parser.add_argument('--parity', type=int, help='Store the file with a header and a parity egg after every PARITY eggs (1-255), so one damaged egg in each group can be repaired when extracting, or with --repair (the header egg, the last cell in Box 14, isn\'t covered)')
+    parser.add_argument('--empty-only', help='Store the file in sequenced eggs in empty cells only, so no pokemon is overwritten, the eggs can then be moved around', action='store_true')
+    parser.add_argument('--boxes', type=edit.parse_boxes, help='Store the file in sequenced eggs in these boxes only, e.g. 10-14 or 1,3,14')
+    parser.add_argument('--layout', choices=steg.layouts, help='Store the file in sequenced eggs, backwards from the end (contiguous) or spread out over the boxes (scattered)')
+    parser.add_argument('--delta', '-d', help='When storing, only rewrite the eggs whose data changed, quicker when a file stored before has changed a little', action='store_true')
+    parser.add_argument('--stats', help='Print counters and the time spent in each phase as JSON (to stderr) when done', action='store_true')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--store', '-s', help='Filepath, to store in save as eggs. Writes backwards from last cell in Box 14')
+    group.add_argument('--extract', '-e', help='Filepath, to extract stored data to. Reads from last cell in Box 14, must have a non egg cell next to final egg (unless stored with a header, then exactly the stored data is read)')
+    group.add_argument('--verify', '-v', help='Filepath, to check if file exists in save. Reads backwards from last cell in Box 14, must have a blank cell nex to final egg (unless stored with a header)')
+    group.add_argument('--check', '-c', help='Check data stored with a header against its own length and digest, no copy of the file is needed', action='store_true')
+    group.add_argument('--repair', help='Rewrite the damaged eggs of a file stored with --parity', action='store_true')
+    group.add_argument('--text-to-b64-names', '-t', help='Text that will be converted to base64, then split across pokemon names. Starts with the first cell in Box 1. If empty cells in box are encountered, a Lv 0 Bulbasaur will be created. Better to make sure enough pokemon are in your box. If the Base64 text fills its last name exactly (and has no =), one more pokemon is renamed to just = to mark where the text ends, so that one can be a Bulbasaur too.')
+    group.add_argument('--extract-b64-names', help='Filepath (- for stdout), to write the text stored with --text-to-b64-names to. Reads names from the first cell in Box 1 until a name that isn\'t 10 Base64 characters, if a pokemon after the text has a Base64 looking name use --num-bytes-extract to trim it')
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ['batch']:
+        from . import batch
+        return batch.main(argv[1:])
+    if argv[:1] == ['stripe']:
+        from . import stripe
+        return stripe.main(argv[1:])
+    if argv[:1] == ['daemon']:
+        from . import daemon
+        return daemon.main(argv[1:])
+    if argv[:1] == ['export']:
+        from . import export
+        return export.main(argv[1:])
+    if argv[:1] == ['edit']:
+        from . import edit
+        return edit.main(argv[1:])
+
+    args = build_parser().parse_args(argv)
+
+    # importing numpy takes longer than it saves when working on a single save, unless it was asked for
+    codec.use_numpy = args.checksum_engine == 'numpy'
+    if codec.use_numpy and not codec.have_numpy():
+        print('The numpy checksum engine was chosen, but numpy isn\'t installed...')
+        print('Exiting, make sure you use the correct options!')
+        sys.exit()
+    codec.checksum_engine = args.checksum_engine
+
+    if args.num_bytes_extract and (not args.extract) and (not args.extract_b64_names):
+        print('Number of bytes to extract were given, but we\'re not extracting...')
+        print('Exiting, make sure you use the correct options!')
+        sys.exit()
+
+    placing = args.empty_only or args.boxes or args.layout
+    if (args.compress or args.compress_level is not None or args.digest or args.delta or args.parity or placing) and (not args.store):
+        print('Compression, digest, parity, placement or delta options were given, but we\'re not storing...')
+        print('Exiting, make sure you use the correct options!')
+        sys.exit()
+
+    if args.parity and placing:
+        print('Parity can\'t be used with --empty-only, --boxes or --layout...')
+        print('Exiting, make sure you use the correct options!')
+        sys.exit()
+
+    if args.compress_level is not None and not args.compress:
+        args.compress = 'zlib'
+
+    if args.compress_level is not None and args.compress_level not in steg.compression_levels[args.compress]:
+        levels = steg.compression_levels[args.compress]
+        print(f'Compression level for {args.compress} must be from {levels[0]} to {levels[-1]}...' if levels else f'Compression {args.compress} has no level...')
+        print('Exiting, make sure you use the correct options!')
+        sys.exit()
+
+    if args.stats:
+        with stats.collecting() as report:
+            run(args)
+        print(json.dumps(report), file=sys.stderr)
+    else:
+        run(args)
+
+
+def run(args):
+    if args.text_to_b64_names:
+        with stats.phase('text_to_b64_names'):
+            actions.text_to_b64_names(args.save_path, args.text_to_b64_names, args.use_backup_save)
+
+    if args.extract_b64_names:
+        try:
+            with stats.phase('extract_b64_names'):
+                actions.b64_names_to_text(args.save_path, args.extract_b64_names, args.num_bytes_extract, args.use_backup_save)
+        except ValueError as e:
+            print(f'Text could not be read from the names: {e}', file=sys.stderr)
+
+    if args.store:
+        with stats.phase('store'):
+            placement = None
+            if args.empty_only or args.boxes or args.layout:
+                placement = {'empty_only': args.empty_only, 'boxes': args.boxes, 'layout': args.layout or 'contiguous'}
+            store_stats = actions.store(args.save_path, args.store, args.use_backup_save, args.compress, args.compress_level, args.digest, args.delta, args.parity or 0, placement)
+        if 'compression' in store_stats:
+            print(f'Stored {store_stats["original_length"]} bytes as {store_stats["stored_length"]} ({store_stats["compression"]}, {store_stats["digest"]}) in {store_stats["eggs"]} eggs, {store_stats["bytes_per_egg"]:.1f} bytes per egg')
+        if args.parity:
+            print(f'{store_stats["parity_eggs"]} of the eggs are parity eggs')
+        if 'slots' in store_stats:
+            print('The eggs, in order, are in box:cell ' + ' '.join(f'{i // 30 + 1}:{i % 30 + 1}' for i in store_stats['slots']))
+        if args.delta:
+            print(f'Rewrote {store_stats["eggs_written"]} of {store_stats["eggs"]} eggs')
+
+    if args.extract:
+        with stats.phase('extract'):
+            actions.extract(args.save_path, args.extract, args.num_bytes_extract, args.use_backup_save)
+
+    if args.verify:
+        with stats.phase('verify'):
+            success = actions.verify(args.save_path, args.verify, args.use_backup_save)
+
+        if success:
+            print('Data validated OK!')
+        else:
+            print('Data could not be validated')
+
+    if args.check:
+        with stats.phase('check'):
+            success, damaged = actions.check(args.save_path, args.use_backup_save)
+
+        if success is None:
+            print('No payload header found, use --verify with the original file')
+        elif success and damaged:
+            print(f'Data validated OK, but only by rebuilding damaged eggs, use --repair to rewrite the {damaged} eggs that need it')
+        elif success:
+            print('Data validated OK!')
+        else:
+            print('Data could not be validated')
+
+    if args.repair:
+        try:
+            with stats.phase('repair'):
+                repaired = actions.repair(args.save_path, args.use_backup_save)
+        except ValueError as e:
+            print(f'Data could not be repaired: {e}')
+        else:
+            if repaired is None:
+                print('No payload header found, nothing to repair')
+            else:
+                print(f'Repaired {repaired} eggs')
@@ -0,0 +1,213 @@
+# encoding and decoding of the bytes that make up a save
+
+import struct
+import sys
+from array import array
+
+from . import stats
+
+# optional, used to decode and encode all box pokemon at once
+# set use_numpy to False to never use it, even when installed
+use_numpy = True
+numpy = None
+
+def have_numpy():
+    # numpy takes longer to import than the rest of the package, so it is only
+    # imported when the first save is loaded, and not when this module is
+    global numpy, use_numpy
+    if use_numpy and numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            use_numpy = False
+    return use_numpy
+
+# only confirmed to apply to English language game
+text_chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/="
+text_bytes = [0xBB,0xBC,0xBD,0xBE,0xBF,0xC0,0xC1,0xC2,0xC3,0xC4,0xC5,0xC6,0xC7,0xC8,0xC9,0xCA,0xCB,0xCC,0xCD,0xCE,0xCF,0xD0,0xD1,0xD2,0xD3,0xD4,0xD5,0xD6,0xD7,0xD8,0xD9,0xDA,0xDB,0xDC,0xDD,0xDE,0xDF,0xE0,0xE1,0xE2,0xE3,0xE4,0xE5,0xE6,0xE7,0xE8,0xE9,0xEA,0xEB,0xEC,0xED,0xEE,0xA1,0xA2,0xA3,0xA4,0xA5,0xA6,0xA7,0xA8,0xA9,0xAA,0x2E,0xBA,0x35]
+char2byte_dict = {}
+byte2char_dict = {}
+for i, char in enumerate(text_chars):
+    curr_byte = text_bytes[i]
+    char2byte_dict[char] = curr_byte
+    byte2char_dict[curr_byte] = char
+
+# names are 10 bytes, ended early by 0xFF
+# 256 entry tables for bytes.translate, so a name (or all the names in the boxes) is converted in one go
+# bytes with no character become '?', characters with no byte become 0x0
+# 0xFF is kept as it is in name_decode_table, so the end of each name can still be found afterwards
+name_length = 10
+name_decode_table = bytes(0xFF if i == 0xFF else ord(byte2char_dict.get(i, '?')) for i in range(256))
+name_encode_table = bytes(char2byte_dict.get(chr(i), 0x0) for i in range(256))
+
+def encode_name_text(text):
+    # text to name bytes, without the 0xFF padding
+    if text.isascii():
+        return text.encode('ascii').translate(name_encode_table)
+    return bytes(char2byte_dict.get(char, 0x0) for char in text)
+
+def encode_names(text):
+    # text split over as many names as needed, the last one padded with 0xFF
+    name_bytes = encode_name_text(text)
+    padding = -len(name_bytes) % name_length
+    return name_bytes + b'\xFF' * padding
+
+def decode_name(name_bytes):
+    text = bytes(name_bytes).translate(name_decode_table).decode('latin-1')
+    return text.partition('\xFF')[0]
+
+def decode_names(name_bytes):
+    # name_bytes is many 10 byte names one after another, returns each name
+    text = bytes(name_bytes).translate(name_decode_table).decode('latin-1')
+    return [text[i : i+name_length].partition('\xFF')[0] for i in range(0, len(text), name_length)]
+
+# some data that makes up a pokemon is stored in a block of 4 parts
+# these parts are stored in 24 permutations
+# we want to be able to reorganize these parts so that we can work with them
+# [0,3,1,2] means that parts ABCD are stored in the order of ACDB
+pokemon_substructure_order_lookup = [[0,1,2,3],[0,1,3,2],[0,2,1,3],[0,3,1,2],[0,2,3,1],[0,3,2,1],[1,0,2,3],[1,0,3,2],[2,0,1,3],[3,0,1,2],[2,0,3,1],[3,0,2,1],[1,2,0,3],[1,3,0,2],[2,1,0,3],[3,1,0,2],[2,3,0,1],[3,2,0,1],[1,2,3,0],[1,3,2,0],[2,1,3,0],[3,1,2,0],[2,3,1,0],[3,2,1,0]]
+
+# one byte at a time, the original implementation, see decrypt_subdata and encrypt_subdata for the fast one
+def xor_subdata(key, subdata):
+    dest = [0x0] * 48
+    for i in range(len(subdata)):
+        # saw in pkhex, clever idea
+        dest[i] = subdata[i] ^ key[i & 3]
+    return dest
+
+def make_subdata_messy_again(substructure_order, subdata):
+    dest = [0x0] * 48
+    for i, part in enumerate(substructure_order):
+        dest[(part*12) : (part*12)+12] = subdata[(i*12) : (i*12)+12]
+    return dest
+
+def make_subdata_organized(substructure_order, subdata):
+    dest = []
+    for i in substructure_order:
+        temp = subdata[(i*12) : (i*12) + 12]
+        dest.extend(temp)
+    return dest
+
+# word level subdata cipher
+# the 48 bytes are xored as one 384 bit int, against the 32 bit key repeated 12 times
+# then the 4 parts are put in order with slices from tables worked out once for each of the 24 orders
+subdata_key_repeat = int.from_bytes(bytes([1, 0, 0, 0]) * 12, byteorder='little')
+# where each organized part starts in the stored subdata
+subdata_organize_starts = [tuple(part*12 for part in order) for order in pokemon_substructure_order_lookup]
+# and the other way around, where each stored part starts in the organized subdata
+subdata_messy_starts = [tuple(order.index(part)*12 for part in range(4)) for order in pokemon_substructure_order_lookup]
+subdata_words = struct.Struct('<24H')
+
+def reorder_subdata_parts(starts, subdata):
+    a, b, c, d = starts
+    return subdata[a:a+12] + subdata[b:b+12] + subdata[c:c+12] + subdata[d:d+12]
+
+def decrypt_subdata(pid, otid, encrypted_subdata):
+    # subdata as stored in the pokemon, to decrypted and organized subdata (a bytearray)
+    # xoring and reordering can be done in either order, the parts are whole 32 bit words
+    subdata = int.from_bytes(encrypted_subdata, byteorder='little') ^ ((pid ^ otid) * subdata_key_repeat)
+    return bytearray(reorder_subdata_parts(subdata_organize_starts[pid % 24], subdata.to_bytes(48, byteorder='little')))
+
+def encrypt_subdata(pid, otid, subdata):
+    # the reverse of decrypt_subdata, returns bytes to store in the pokemon
+    messy = reorder_subdata_parts(subdata_messy_starts[pid % 24], bytes(subdata))
+    encrypted = int.from_bytes(messy, byteorder='little') ^ ((pid ^ otid) * subdata_key_repeat)
+    return encrypted.to_bytes(48, byteorder='little')
+
+def gen_subdata_checksum(subdata):
+    # sum of the 24 little endian 16 bit words
+    checksum = sum(subdata_words.unpack(bytes(subdata))) & 0xFFFF
+    return checksum.to_bytes(2, byteorder='little')
+
+# sum of the little endian 32 bit words in a save section, folded to 16 bits
+# there are a few ways of doing the sum, all giving the same checksum:
+#   python  one word at a time, the original implementation
+#   words   the whole section at once as an array of 32 bit words (default)
+#   numpy   the same using numpy, falls back to words if numpy isn't available
+#   check   runs words and python, and raises ValueError if they disagree
+checksum_engine = 'words'
+
+def fold_section_sum(section_sum):
+    section_sum &= 0xFFFFFFFF
+    return ((section_sum >> 16) + (section_sum & 0xFFFF)) & 0xFFFF
+
+def section_checksum_python(section_data):
+    section_sum = 0
+    it = iter(section_data)
+    for a in it:
+        b = next(it)
+        c = next(it)
+        d = next(it)
+        value = (d << 24) | (c << 16) | (b << 8) | a
+        section_sum = (section_sum + value) & 0xFFFFFFFF
+    return fold_section_sum(section_sum)
+
+# array typecode for unsigned 32 bit ints, 'I' is 4 bytes on every platform we care about
+word_typecode = 'I' if array('I').itemsize == 4 else 'L'
+
+def section_checksum_words(section_data):
+    words = array(word_typecode)
+    words.frombytes(section_data)
+    if sys.byteorder == 'big':
+        words.byteswap()
+    return fold_section_sum(sum(words))
+
+def section_checksum_numpy(section_data):
+    if not have_numpy():
+        return section_checksum_words(section_data)
+    words = numpy.frombuffer(section_data, dtype='<u4')
+    return fold_section_sum(int(words.sum(dtype=numpy.uint64)))
+
+def section_checksum_check(section_data):
+    checksum = section_checksum_words(section_data)
+    if checksum != section_checksum_python(section_data):
+        raise ValueError('Checksum engines disagree!')
+    return checksum
+
+checksum_engines = {
+    'python': section_checksum_python,
+    'words': section_checksum_words,
+    'numpy': section_checksum_numpy,
+    'check': section_checksum_check,
+}
+
+def section_checksum(section_data):
+    return checksum_engines[checksum_engine](section_data)
+
+# numpy versions of the pokemon subdata decrypt/encrypt, working on many pokemon at once
+# the subdata is handled as 12 little endian 32 bit words, so each of the 4 parts is 3 words
+# and the xor key (pid ^ otid) is applied to every word
+def decode_subdata_batch(pokemon_data):
+    # pokemon_data is 80 bytes per pokemon, returns a (count, 48) array of decrypted organized subdata
+    if not have_numpy():
+        raise RuntimeError('decode_subdata_batch needs numpy, which isn\'t installed or use_numpy is False')
+    raw = numpy.frombuffer(bytes(pokemon_data), dtype=numpy.uint8).reshape(-1, 80)
+    if stats.enabled:
+        stats.count('subdata_decrypts', len(raw))
+    pid = raw[:, 0:4].copy().view('<u4')[:, 0]
+    otid = raw[:, 4:8].copy().view('<u4')[:, 0]
+    words = raw[:, 32:80].copy().view('<u4')
+    words ^= (pid ^ otid)[:, None]
+    parts = words.reshape(-1, 4, 3)
+    part_order = numpy.array(pokemon_substructure_order_lookup)[pid % 24]
+    organized = parts[numpy.arange(len(parts))[:, None], part_order]
+    return organized.reshape(-1, 12).view(numpy.uint8)
+
+def encode_subdata_batch(pids, otids, subdata):
+    # subdata is a (count, 48) array of organized subdata
+    # returns a (count, 48) array of encrypted subdata, and the (count,) subdata checksums
+    if not have_numpy():
+        raise RuntimeError('encode_subdata_batch needs numpy, which isn\'t installed or use_numpy is False')
+    pid = numpy.array(pids, dtype=numpy.uint32)
+    otid = numpy.array(otids, dtype=numpy.uint32)
+    if stats.enabled:
+        stats.count('subdata_encrypts', len(pid))
+    subdata = numpy.ascontiguousarray(subdata, dtype=numpy.uint8)
+    checksums = subdata.view('<u2').sum(axis=1, dtype=numpy.uint32) & 0xFFFF
+    parts = subdata.view('<u4').reshape(-1, 4, 3)
+    part_order = numpy.array(pokemon_substructure_order_lookup)[pid % 24]
+    messy = numpy.empty_like(parts)
+    messy[numpy.arange(len(parts))[:, None], part_order] = parts
+    words = messy.reshape(-1, 12)
+    words ^= (pid ^ otid)[:, None]
+    return words.view(numpy.uint8), checksums
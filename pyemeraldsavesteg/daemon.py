@@ -0,0 +1,285 @@
+# daemon mode, keeps parsed saves in memory and answers questions about them over a socket
+#
+#   PyEmeraldSaveSteg.py daemon [--socket /tmp/pess.sock] [--max-saves N]
+#   PyEmeraldSaveSteg.py daemon --port 8765 --token-file pess.token [--max-saves N]
+#
+# the daemon reads and writes whatever paths it is sent, with the permissions of the user running it
+# the Unix socket (the default) is only usable by that user, any local user can connect to a port,
+# so a port needs a token, which every request has to carry as "token"
+#
+# the protocol is one json object per line each way, for example
+#   {"operation": "verify", "save_path": "emerald.sav", "payload_path": "secret.bin"}
+#   {"status": "ok", "verified": true, "cached": true, "seconds": 0.0004}
+# operations, all take save_path and use_backup_save:
+#   extract     data (base64), or output_path to write it to a file, and num_bytes
+#   verify      payload_path
+#   check       data stored with a header against its own digest, and damaged_eggs, how many eggs --repair would rewrite
+#   list_slots  every pokemon in the boxes, or only those in box (1-14, anything else is an error)
+#   store       payload_path, compression, level, digest, delta and parity like the command line, writes the save file
+#               placement, a dict of empty_only, boxes and layout, stores it in sequenced eggs, see steg.hide_placed
+#   status      what is in the cache, and how many locks are kept
+# a request that fails gets {"status": "error", "error": ...}, like batch mode
+#
+# saves are kept in a least recently used cache, a cached save is used as long as its file's mtime and size haven't changed
+# every operation on a save holds that save's lock, so stores to the same file happen one at a time
+
+import argparse
+import asyncio
+import base64
+import hmac
+import json
+import os
+import secrets
+import signal
+import socket
+import tempfile
+import time
+from collections import OrderedDict
+
+from . import actions, export, steg
+
+operations = ('extract', 'verify', 'check', 'list_slots', 'store', 'status')
+
+
+class save_cache:
+    # parsed saves by path, the least recently used is dropped once there are more than max_saves
+
+    def __init__(self, max_saves=64):
+        self.max_saves = max_saves
+        self.saves = OrderedDict()
+        self.locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lock(self, save_path):
+        if save_path not in self.locks:
+            self.locks[save_path] = asyncio.Lock()
+        return self.locks[save_path]
+
+    def get(self, save_path):
+        # returns the save and whether it came from the cache
+        file_stat = os.stat(save_path)
+        entry = self.saves.get(save_path)
+        if entry is not None and entry[0] == (file_stat.st_mtime_ns, file_stat.st_size):
+            self.saves.move_to_end(save_path)
+            self.hits += 1
+            return entry[1], True
+        self.misses += 1
+        pokemon_save = actions.load_save(save_path)
+        self.put(save_path, pokemon_save, file_stat)
+        return pokemon_save, False
+
+    def put(self, save_path, pokemon_save, file_stat):
+        self.saves[save_path] = ((file_stat.st_mtime_ns, file_stat.st_size), pokemon_save)
+        self.saves.move_to_end(save_path)
+        while len(self.saves) > self.max_saves:
+            # the save's lock is dropped later by prune_locks, a request may be holding it
+            self.saves.popitem(last=False)
+
+    def drop(self, save_path):
+        self.saves.pop(save_path, None)
+
+    def prune_locks(self):
+        # drops the locks of saves no longer cached, unless one is held (and so may have requests waiting on it)
+        # on the event loop, not in a worker thread
+        for save_path in [path for path, lock in self.locks.items() if path not in self.saves and not lock.locked()]:
+            del self.locks[save_path]
+
+
+def run_operation(cache, request):
+    # runs in a worker thread, with the save's lock held
+    operation = request['operation']
+    save_path = request['save_path']
+    use_backup_save = request.get('use_backup_save', False)
+    result = {}
+    pokemon_save, result['cached'] = cache.get(save_path)
+    block = actions.select_save(pokemon_save, use_backup_save)
+
+    if operation == 'extract':
+        info = steg.read_payload_header(block)
+        if info is not None:
+            secret_data = b''.join(steg.iter_payload(block, info))
+        else:
+            secret_data = block.extract_secret_data()
+            if request.get('num_bytes'):
+                secret_data = secret_data[0:int(request['num_bytes'])]
+        if request.get('output_path'):
+            with open(request['output_path'], 'wb') as fh:
+                fh.write(secret_data)
+        else:
+            result['data'] = base64.standard_b64encode(secret_data).decode('ascii')
+        result['length'] = len(secret_data)
+    elif operation == 'verify':
+        with open(request['payload_path'], 'rb') as fh:
+            result['verified'] = block.verify_secret_data(bytearray(fh.read()))
+    elif operation == 'check':
+        repairs = []
+        result['verified'] = block.check_payload(repairs)
+        result['damaged_eggs'] = len(repairs)
+    elif operation == 'list_slots':
+        box = request.get('box')
+        if box is not None and (not isinstance(box, int) or not 1 <= box <= 14):
+            raise ValueError(f'Box must be from 1 to 14: {box}')
+        result['slots'] = list(export.iter_records(block, box=box))
+    elif operation == 'store':
+        try:
+            result.update(actions.store_in_block(block, request['payload_path'], request.get('compression'), request.get('level'), request.get('digest'), request.get('delta', False), request.get('parity', 0), request.get('placement')))
+            actions.write_save(save_path, pokemon_save)
+        except Exception:
+            # the cached save may be half changed, read it again next time
+            cache.drop(save_path)
+            raise
+        # the save in memory is what was just written, so it stays cached under the file's new mtime
+        cache.put(save_path, pokemon_save, os.stat(save_path))
+    return result
+
+
+async def handle_request(cache, request):
+    start = time.perf_counter()
+    try:
+        operation = request.get('operation')
+        if operation not in operations:
+            raise ValueError(f'Unknown operation: {operation}')
+        if operation == 'status':
+            result = {'saves': list(cache.saves), 'max_saves': cache.max_saves, 'locks': len(cache.locks), 'hits': cache.hits, 'misses': cache.misses}
+        else:
+            save_path = os.path.realpath(request['save_path'])
+            request = dict(request, save_path=save_path)
+            try:
+                async with cache.lock(save_path):
+                    # in a thread, so a slow store doesn't hold up requests for other saves
+                    result = await asyncio.to_thread(run_operation, cache, request)
+            finally:
+                cache.prune_locks()
+        result = dict(status='ok', **result)
+    except Exception as e:
+        result = {'status': 'error', 'error': f'{type(e).__name__}: {e}'}
+    result['seconds'] = round(time.perf_counter() - start, 6)
+    return result
+
+
+async def handle_connection(cache, token, reader, writer):
+    # a connection can send any number of requests, one per line, answered in order
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError('Request must be a json object')
+                if token is not None and not hmac.compare_digest(str(request.pop('token', '')), token):
+                    raise PermissionError('Missing or wrong token')
+            except (ValueError, PermissionError) as e:
+                result = {'status': 'error', 'error': f'{type(e).__name__}: {e}'}
+            else:
+                result = await handle_request(cache, request)
+            writer.write(json.dumps(result).encode('utf-8') + b'\n')
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(socket_path=None, port=None, max_saves=64, token=None):
+    # with a port, token is required
+    cache = save_cache(max_saves)
+    handler = lambda reader, writer: handle_connection(cache, token, reader, writer)
+    if socket_path:
+        # only this user can connect, the socket is made with no permissions for anyone else
+        old_umask = os.umask(0o177)
+        try:
+            server = await asyncio.start_unix_server(handler, path=socket_path)
+        finally:
+            os.umask(old_umask)
+    else:
+        if token is None:
+            raise ValueError('A token is needed to listen on a port')
+        # only local connections, but from any local user
+        server = await asyncio.start_server(handler, host='127.0.0.1', port=port)
+    # stopping on SIGTERM the same as ctrl-c, so the socket file is removed
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+class client:
+    # a blocking connection to the daemon, for scripts and benchmarks
+    #   with client(socket_path='/tmp/pess.sock') as daemon:
+    #       daemon.request('verify', save_path='emerald.sav', payload_path='secret.bin')
+    # with a port, give the token too, it is sent with every request
+
+    def __init__(self, socket_path=None, port=None, token=None):
+        self.token = token
+        if socket_path:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.connect(socket_path)
+        else:
+            self.socket = socket.create_connection(('127.0.0.1', port))
+        self.file = self.socket.makefile('rwb')
+
+    def request(self, operation, **fields):
+        if self.token is not None:
+            fields['token'] = self.token
+        self.file.write(json.dumps(dict(operation=operation, **fields)).encode('utf-8') + b'\n')
+        self.file.flush()
+        return json.loads(self.file.readline())
+
+    def close(self):
+        self.file.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def default_socket_path():
+    return os.path.join(tempfile.gettempdir(), f'pyemeraldsavesteg-{os.getuid()}.sock')
+
+
+def read_token(token_path):
+    # the token in token_path, a new random one is written there (readable only by this user) if it doesn't exist
+    try:
+        fd = os.open(token_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(token_path) as fh:
+            token = fh.read().strip()
+        if not token:
+            raise ValueError(f'Token file is empty: {token_path}')
+        return token
+    token = secrets.token_hex(16)
+    with os.fdopen(fd, 'w') as fh:
+        fh.write(token + '\n')
+    return token
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='PyEmeraldSaveSteg.py daemon')
+    address = parser.add_mutually_exclusive_group()
+    address.add_argument('--socket', '-s', help=f'Path of the Unix socket to listen on, only usable by this user (the default, {default_socket_path()})')
+    address.add_argument('--port', '-p', type=int, help='Port to listen on, localhost only, needs --token-file')
+    parser.add_argument('--token-file', '-t', help='File holding the token every request must carry, a new random one is written if it doesn\'t exist (needed with --port, optional with --socket)')
+    parser.add_argument('--max-saves', '-m', type=int, default=64, help='Number of parsed saves to keep in memory (default 64)')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.port is not None and not args.token_file:
+        parser.error('--port needs --token-file, any local user can connect to a port')
+    socket_path = args.socket if args.port is None else None
+    if args.port is None and not socket_path:
+        socket_path = default_socket_path()
+    token = read_token(args.token_file) if args.token_file else None
+    try:
+        asyncio.run(serve(socket_path, args.port, args.max_saves, token))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
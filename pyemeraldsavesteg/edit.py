@@ -0,0 +1,112 @@
+# bulk editing, making the same changes to many pokemon at once
+#
+#   PyEmeraldSaveSteg.py edit <save_path> [--boxes 1-5] [--species 25] [--include-eggs] [--ivs 31] [--level 50] ...
+#
+# the pokemon are picked by box, species and whether they are eggs, then every change is made with one
+# pokemon.update() each, so each pokemon is decrypted once, and encrypted and checksummed once when committed
+# eggs holding stored data and pokemon of no known species are never picked, changing them would break the data
+# data stored without a header has no length, so then every egg backwards from the last cell counts as stored data
+
+import argparse
+
+from . import actions, model, steg
+
+
+def parse_boxes(text):
+    # '1-5,7' -> [1, 2, 3, 4, 5, 7]
+    boxes = []
+    for part in text.split(','):
+        first, _, last = part.partition('-')
+        boxes.extend(range(int(first), int(last or first) + 1))
+    if any(not 1 <= box <= 14 for box in boxes):
+        raise ValueError('Boxes must be from 1 to 14')
+    return boxes
+
+
+def parse_values(text, count):
+    # '31' -> [31] * count, or count values split by commas
+    values = [int(value) for value in text.split(',')]
+    if len(values) == 1:
+        return values * count
+    if len(values) != count:
+        raise ValueError(f'Needs 1 or {count} values: {text}')
+    return values
+
+
+def select_slots(block, boxes=None, species=None, include_eggs=False):
+    # indexes into pokemon_list of the pokemon in boxes (1-14) and of species (national ids)
+    # None means any box or species, empty cells are always left out, and eggs unless include_eggs
+    # the eggs of a payload stored with a header, the eggs backwards from the last cell when there is no header
+    # (they could be data stored without one), and anything with no known species never are
+    indexes = range(420) if boxes is None else [i for box in sorted(set(boxes)) for i in range((box-1) * 30, box * 30)]
+    species_ids = block.species_ids()
+    occupancy = block.occupancy
+    payload_slots = (steg.payload_slots(block) | steg.legacy_slots(block)) if include_eggs else set()
+    selected = []
+    for i in indexes:
+        if occupancy[i] == model.slot_empty or species_ids[i] == 0:
+            continue
+        if occupancy[i] == model.slot_egg and (not include_eggs or i in payload_slots):
+            continue
+        if species is not None and species_ids[i] not in species:
+            continue
+        selected.append(i)
+    return selected
+
+
+def bulk_edit(block, indexes, **fields):
+    # fields as for pokemon.update(), returns how many pokemon were changed,
+    # and (index, reason) for each one that was skipped because it can't take them (like a level for an unknown species)
+    # the values are checked for all of them first, so a bad value raises ValueError with nothing changed
+    # commit the block afterwards to encrypt them, all at once with numpy
+    model.check_update_fields(fields)
+    edited = 0
+    skipped = []
+    for i in indexes:
+        try:
+            block.pokemon_list[i].update(**fields)
+        except ValueError as e:
+            # update() changes nothing when it raises
+            skipped.append((i, str(e)))
+        else:
+            edited += 1
+    return edited, skipped
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='PyEmeraldSaveSteg.py edit')
+    parser.add_argument('save_path', help='Filepath to save, used for reading and writing (good idea to make a backup first)')
+    parser.add_argument('--use-backup-save', '-b', help='Use the backup save (not the current save)', action='store_true')
+    select = parser.add_argument_group('which pokemon to edit, all of them by default')
+    select.add_argument('--boxes', type=parse_boxes, help='Boxes, e.g. 1-5 or 1,3,14')
+    select.add_argument('--species', type=lambda text: {int(value) for value in text.split(',')}, help='National ids, e.g. 25 or 25,26')
+    select.add_argument('--include-eggs', help='Edit eggs too, they are left alone by default (eggs holding stored data always are, without a header that is every egg backwards from the last cell)', action='store_true')
+    change = parser.add_argument_group('changes, any number of them')
+    change.add_argument('--ivs', type=lambda text: parse_values(text, 6), help='One IV for all six stats, or six split by commas (HP, Atk, Def, Spd, SpAtk, SpDef)')
+    change.add_argument('--evs', type=lambda text: parse_values(text, 6), help='One EV for all six stats, or six split by commas')
+    change.add_argument('--moves', type=lambda text: parse_values(text, 4), help='Four move ids split by commas')
+    change.add_argument('--level', type=int, help='Level, the exp is set to the start of it for each species')
+    change.add_argument('--exp', type=int, help='Exp')
+    change.add_argument('--item', type=int, help='Held item id, 0 for none')
+    change.add_argument('--ability', type=int, choices=(1, 2), help='Ability, 1 or 2')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    fields = {field: getattr(args, field) for field in ('ivs', 'evs', 'moves', 'level', 'exp', 'item', 'ability') if getattr(args, field) is not None}
+    if not fields:
+        parser.error('Nothing to change, give at least one of --ivs, --evs, --moves, --level, --exp, --item or --ability')
+
+    pokemon_save = actions.load_save(args.save_path)
+    block = actions.select_save(pokemon_save, args.use_backup_save)
+    indexes = select_slots(block, args.boxes, args.species, args.include_eggs)
+    try:
+        edited, skipped = bulk_edit(block, indexes, **fields)
+    except ValueError as e:
+        parser.error(str(e))
+    actions.write_save(args.save_path, pokemon_save)
+    print(f'Edited {edited} pokemon')
+    for i, reason in skipped:
+        print(f'Skipped box {i // 30 + 1} cell {i % 30 + 1}: {reason}')
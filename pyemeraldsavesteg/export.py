@@ -0,0 +1,97 @@
+# exporting the pokemon in the boxes, one record per pokemon, as json lines or csv
+#
+#   PyEmeraldSaveSteg.py export [--format jsonl|csv] [--output path] <save_path> [<save_path> ...]
+#
+# saves are read one at a time and each record is written as soon as it is made,
+# so exporting hundreds of saves doesn't keep them in memory
+# each pokemon is decrypted once for its record, see pokemon.record()
+# a save that can't be read is reported on stderr and the rest carry on
+
+import argparse
+import csv
+import json
+import sys
+
+from . import actions
+
+formats = ('jsonl', 'csv')
+stat_names = ('hp', 'atk', 'def', 'spd', 'spatk', 'spdef')
+# csv has no lists, so ivs, evs and moves get a column each
+csv_fields = (('save_path', 'box', 'cell', 'species', 'name', 'egg', 'level', 'exp')
+              + tuple(f'iv_{stat}' for stat in stat_names)
+              + tuple(f'ev_{stat}' for stat in stat_names)
+              + ('move_1', 'move_2', 'move_3', 'move_4', 'item', 'pid', 'otid', 'ability', 'pokerus'))
+
+
+def iter_records(block, save_path=None, box=None):
+    # yields a dict for every pokemon in the boxes, or only in box (1-14), empty cells are left out
+    indexes = range(420) if box is None else range((box-1) * 30, box * 30)
+    for i in indexes:
+        this_pokemon = block.pokemon_list[i]
+        if this_pokemon.is_clear():
+            continue
+        record = {} if save_path is None else {'save_path': save_path}
+        record['box'] = i // 30 + 1
+        record['cell'] = i % 30 + 1
+        record.update(this_pokemon.record())
+        yield record
+
+
+def csv_row(record):
+    row = dict(record)
+    for column, values in (('iv', row.pop('ivs')), ('ev', row.pop('evs'))):
+        for stat, value in zip(stat_names, values):
+            row[f'{column}_{stat}'] = value
+    for number, move in enumerate(row.pop('moves'), 1):
+        row[f'move_{number}'] = move
+    return row
+
+
+def iter_saves(save_paths, use_backup_save=False, errors=None):
+    # yields the records of every save in turn
+    # with errors (a file), saves that can't be read are reported there instead of raising
+    for save_path in save_paths:
+        try:
+            block = actions.select_save(actions.load_save(save_path), use_backup_save)
+        except Exception as e:
+            # anything, like batch mode, a save that isn't one can fail deep in the model
+            if errors is None:
+                raise
+            print(f'{save_path}: {type(e).__name__}: {e}', file=errors)
+            continue
+        yield from iter_records(block, save_path)
+
+
+def write_records(records, fh, format='jsonl'):
+    # returns how many records were written
+    count = 0
+    if format == 'csv':
+        writer = csv.DictWriter(fh, fieldnames=csv_fields)
+        writer.writeheader()
+        for record in records:
+            writer.writerow(csv_row(record))
+            count += 1
+    else:
+        for record in records:
+            fh.write(json.dumps(record) + '\n')
+            count += 1
+    return count
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='PyEmeraldSaveSteg.py export')
+    parser.add_argument('save_paths', nargs='+', help='Saves to export the boxes of')
+    parser.add_argument('--format', '-f', choices=formats, default='jsonl', help='JSON Lines (default) or CSV')
+    parser.add_argument('--output', '-o', default='-', help='File to write to, - for stdout (default)')
+    parser.add_argument('--use-backup-save', '-b', help='Use the backup save (not the current save)', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    records = iter_saves(args.save_paths, args.use_backup_save, errors=sys.stderr)
+    if args.output == '-':
+        write_records(records, sys.stdout, args.format)
+    else:
+        with open(args.output, 'w', newline='') as fh:
+            write_records(records, fh, args.format)
@@ -0,0 +1,1196 @@
+# the pokemon, sections and save blocks that make up a save
+
+import mmap
+import struct
+from array import array
+from bisect import bisect_right
+from enum import Enum
+
+from . import codec, stats, steg
+from .codec import (decode_name, decode_names, decode_subdata_batch, decrypt_subdata, encode_names,
+                    encode_subdata_batch, encrypt_subdata, gen_subdata_checksum, section_checksum)
+
+class ExpType(Enum):
+    MEDIUM_SLOW = 1
+    MEDIUM_FAST = 2
+    FAST = 3
+    SLOW = 4
+    ERRATIC = 5
+    FLUCTUATING = 6
+
+# exp type of each species, index is the national id - 1
+exp_types = (ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.FLUCTUATING,ExpType.FLUCTUATING,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.FLUCTUATING,ExpType.FLUCTUATING,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_SLOW,ExpType.FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.SLOW,ExpType.SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.ERRATIC,ExpType.FLUCTUATING,ExpType.MEDIUM_SLOW,ExpType.FLUCTUATING,ExpType.FLUCTUATING,ExpType.SLOW,ExpType.SLOW,ExpType.FLUCTUATING,ExpType.FLUCTUATING,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.FLUCTUATING,ExpType.FAST,ExpType.FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.FLUCTUATING,ExpType.FLUCTUATING,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.FAST,ExpType.SLOW,ExpType.FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_FAST,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.MEDIUM_SLOW,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.ERRATIC,ExpType.SLOW,ExpType.FAST,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW,ExpType.SLOW)
+
+# total exp needed for each level, index is the level - 1
+exp_tables = {
+    ExpType.MEDIUM_SLOW: (0,9,57,96,135,179,236,314,419,560,742,973,1261,1612,2035,2535,3120,3798,4575,5460,6458,7577,8825,10208,11735,13411,15244,17242,19411,21760,24294,27021,29949,33084,36435,40007,43808,47846,52127,56660,61450,66505,71833,77440,83335,89523,96012,102810,109923,117360,125126,133229,141677,150476,159635,169159,179056,189334,199999,211060,222522,234393,246681,259392,272535,286115,300140,314618,329555,344960,360838,377197,394045,411388,429235,447591,466464,485862,505791,526260,547274,568841,590969,613664,636935,660787,685228,710266,735907,762160,789030,816525,844653,873420,902835,932903,963632,995030,1027103,1059860),
+    ExpType.MEDIUM_FAST: (0,8,27,64,125,216,343,512,729,1000,1331,1728,2197,2744,3375,4096,4913,5832,6859,8000,9261,10648,12167,13824,15625,17576,19683,21952,24389,27000,29791,32768,35937,39304,42875,46656,50653,54872,59319,64000,68921,74088,79507,85184,91125,97336,103823,110592,117649,125000,132651,140608,148877,157464,166375,175616,185193,195112,205379,216000,226981,238328,250047,262144,274625,287496,300763,314432,328509,343000,357911,373248,389017,405224,421875,438976,456533,474552,493039,512000,531441,551368,571787,592704,614125,636056,658503,681472,704969,729000,753571,778688,804357,830584,857375,884736,912673,941192,970299,1000000),
+    ExpType.FAST: (0,6,21,51,100,172,274,409,583,800,1064,1382,1757,2195,2700,3276,3930,4665,5487,6400,7408,8518,9733,11059,12500,14060,15746,17561,19511,21600,23832,26214,28749,31443,34300,37324,40522,43897,47455,51200,55136,59270,63605,68147,72900,77868,83058,88473,94119,100000,106120,112486,119101,125971,133100,140492,148154,156089,164303,172800,181584,190662,200037,209715,219700,229996,240610,251545,262807,274400,286328,298598,311213,324179,337500,351180,365226,379641,394431,409600,425152,441094,457429,474163,491300,508844,526802,545177,563975,583200,602856,622950,643485,664467,685900,707788,730138,752953,776239,800000),
+    ExpType.SLOW: (0,10,33,80,156,270,428,640,911,1250,1663,2160,2746,3430,4218,5120,6141,7290,8573,10000,11576,13310,15208,17280,19531,21970,24603,27440,30486,33750,37238,40960,44921,49130,53593,58320,63316,68590,74148,80000,86151,92610,99383,106480,113906,121670,129778,138240,147061,156250,165813,175760,186096,196830,207968,219520,231491,243890,256723,270000,283726,297910,312558,327680,343281,359370,375953,393040,410636,428750,447388,466560,486271,506530,527343,548720,570666,593190,616298,640000,664301,689210,714733,740880,767656,795070,823128,851840,881211,911250,941963,973360,1005446,1038230,1071718,1105920,1140841,1176490,1212873,1250000),
+    ExpType.ERRATIC: (0,15,52,122,237,406,637,942,1326,1800,2369,3041,3822,4719,5737,6881,8155,9564,11111,12800,14632,16610,18737,21012,23437,26012,28737,31610,34632,37800,41111,44564,48155,51881,55737,59719,63822,68041,72369,76800,81326,85942,90637,95406,100237,105122,110052,115015,120001,125000,131324,137795,144410,151165,158056,165079,172229,179503,186894,194400,202013,209728,217540,225443,233431,241496,249633,257834,267406,276458,286328,296358,305767,316074,326531,336255,346965,357812,367807,378880,390077,400293,411686,423190,433572,445239,457001,467489,479378,491346,501878,513934,526049,536557,548720,560922,571333,583539,591882,600000),
+    ExpType.FLUCTUATING: (0,4,13,32,65,112,178,276,393,540,745,967,1230,1591,1957,2457,3046,3732,4526,5440,6482,7666,9003,10506,12187,14060,16140,18439,20974,23760,26811,30146,33780,37731,42017,46656,50653,55969,60505,66560,71677,78533,84277,91998,98415,107069,114205,123863,131766,142500,151222,163105,172697,185807,196322,210739,222231,238036,250562,267840,281456,300293,315059,335544,351520,373744,390991,415050,433631,459620,479600,507617,529063,559209,582187,614566,639146,673863,700115,737280,765275,804997,834809,877201,908905,954084,987754,1035837,1071552,1122660,1160499,1214753,1254796,1312322,1354652,1415577,1460276,1524731,1571884,1640000),
+}
+
+# index is the internal id, value is the national id
+internal_to_national = array('H', [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,252,253,254,255,256,257,258,259,260,261,262,263,264,265,266,267,268,269,270,271,272,273,274,275,290,291,292,276,277,285,286,327,278,279,283,284,320,321,300,301,352,343,344,299,324,302,339,340,370,341,342,349,350,318,319,328,329,330,296,297,309,310,322,323,363,364,365,331,332,361,362,337,338,298,325,326,311,312,303,307,308,333,334,360,355,356,315,287,288,289,316,317,357,293,294,295,366,367,368,359,353,354,336,335,369,304,305,306,351,313,314,345,346,347,348,280,281,282,371,372,373,374,375,376,377,378,379,382,383,384,380,381,385,386,358])
+# index is the national id, value is the internal id
+national_to_internal = array('H', [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,193,194,195,196,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,243,244,245,246,247,248,249,250,251,277,278,279,280,281,282,283,284,285,286,287,288,289,290,291,292,293,294,295,296,297,298,299,300,304,305,309,310,392,393,394,311,312,306,307,364,365,366,301,302,303,370,371,372,335,336,350,320,315,316,322,355,382,383,384,356,357,337,338,353,354,386,387,363,367,368,330,331,313,314,339,340,321,351,352,308,332,333,334,344,345,358,359,380,379,348,349,323,324,326,327,318,319,388,389,390,391,328,329,385,317,377,378,361,362,369,411,376,360,346,347,341,342,343,373,374,375,381,325,395,396,397,398,399,400,401,402,403,407,408,404,405,406,409,410])
+
+def internal_to_national_ids(internal_ids):
+    # converts a whole column of internal species ids at once, ids with no national id become 0
+    # (eggs used for hiding data can have any species id)
+    # returns a list
+    if codec.use_numpy and codec.have_numpy():
+        numpy = codec.numpy
+        internal_ids = numpy.asarray(internal_ids, dtype=numpy.intp)
+        table = numpy.frombuffer(internal_to_national, dtype=numpy.uint16)
+        in_range = internal_ids < len(table)
+        return numpy.where(in_range, table[numpy.where(in_range, internal_ids, 0)], 0).tolist()
+    table_size = len(internal_to_national)
+    return [internal_to_national[i] if i < table_size else 0 for i in internal_ids]
+
+def level_from_exp(exp_table, exp):
+    # the first level whose total exp is more than exp, is the level after ours
+    # Ex: lookup table = [0,15,52,...], pokemon's exp = 50, bisect gives 2 since 52 is bigger than 50
+    # We return 2 as the level. (level is index+1, can't have level 0!)
+    return bisect_right(exp_table, exp)
+
+def level_from_species_exp(national_id, exp):
+    # None for species with no national id, like eggs holding data
+    if not 0 < national_id <= len(exp_types):
+        return None
+    return level_from_exp(exp_tables[exp_types[national_id-1]], exp)
+
+# the fields of decrypted, organized subdata that pokemon.record() uses
+#   growth   species, held item, exp, (pp bonuses, friendship, unknown)
+#   attacks  4 moves, (4 pp)
+#   evs      6 evs, (6 contest stats)
+#   misc     pokerus, (met location, origins), ivs/egg/ability, (ribbons)
+subdata_fields = struct.Struct('<HHI4x4H4x6B6xB3xI4x')
+
+class pokemon:
+    # there are 840 of these per save, so no __dict__ for each
+    __slots__ = ('__buffer', '__offset', '__view', '__subdata_cache', '__subdata_dirty', 'modified')
+
+    def __init__(self, pokemon_bytes, subdata=None, offset=None):
+        # pokemon_bytes is the pokemon's own 80 writable bytes
+        # or with an offset, a buffer shared with other pokemon (a save_block's box_data) that this pokemon starts at
+        # then changes are made straight to the shared buffer, see bytes_
+        self.__buffer = pokemon_bytes
+        self.__offset = offset
+        self.__view = pokemon_bytes if offset is None else None
+        # decrypted and organized copy of the subdata, see __subdata
+        # can be given when it was already decrypted, see decode_subdata_batch
+        self.__subdata_cache = subdata
+        self.__subdata_dirty = False
+        # set whenever the pokemon changes, so save_block.commit() knows which pokemon to write back
+        # set it yourself after changing bytes_ directly
+        self.modified = False
+        if stats.enabled:
+            stats.count('pokemon_built')
+
+    @property
+    def bytes_(self):
+        # the view into a shared buffer is only made once the pokemon is used, most never are
+        if self.__view is None:
+            self.__view = memoryview(self.__buffer)[self.__offset : self.__offset+80]
+        return self.__view
+
+    def clear(self):
+        # in place, bytes_ can be a view
+        self.bytes_[:] = bytes(80)
+        self.__subdata_cache = None
+        self.__subdata_dirty = False
+        self.modified = True
+    
+    def is_clear(self):
+        # subdata changes only reach bytes_ once flushed
+        if self.__subdata_dirty:
+            self.flush()
+        return not any(self.bytes_)
+
+    def __internal_species_id_to_national_id(self, species_id):
+        return internal_to_national[species_id]
+
+    def __national_id_to_internal_species_id(self, national_id):
+        return national_to_internal[national_id]
+
+    def __write_value_to_subdata(self, value, position, size):
+        # this function exists because we cannot set a part/slice of a property
+        # meaning this won't work: self.__subdata[6] = 0xFF
+        # putting subdata in a separate class and using __setitem__ would let us set data like that
+        # but then we'd have to keep the bytes of that subdata class up to date with this main pokemon class each time
+        # an easy solution is to get all the subdata, edit what we need, and then set it all back
+        temp = self.__subdata
+        temp[position: position+size] = value.to_bytes(size, byteorder='little')
+        self.__subdata = temp
+
+    def hide_secret_data(self, hide_data):
+        if len(hide_data) != 67:
+            raise ValueError('Data is not the right size')
+
+        # clear the pokemon so that we start with 0s
+        self.clear()
+
+        # places where we store hidden data in the subdata
+        # subdata (size is 48 bytes):
+        #   2 byte @ subdata[0:2] species id, illegal values are fine if egg
+        #   NONE x 2 @ subdata[2:4] held item, illegal for eggs to have an item, shows in pc item mover and in party
+        #   16 bytes @ subdata[4:20], subdata section 
+        #   NONE x 4 @ subdata[20:24], skipping PP bytes since these get reset on move in box
+        #   12 bytes @ subdata[24:36] subdata section
+        #   NONE x 1 @ subdata[36:37], pkrs, illegal for eggs to have, it shows up in summary
+        #   1 bytes @ subdata[37:38], met location, hidden if egg
+        #   1 byte @ subdata[38:40], origins, 2 byte value, use lower byte, upper half contains pokeball used, shows on egg summary. illegal if not a pokeball 
+        #   3 bytes @ subdata[40:44], we have 4 bytes but last bit is used for egg flag
+        #   4 bytes @ subdata[44:48], ribbons and obedience, hidden if egg
+        #   1 byte @ using bits from other values
+        # total bytes stored in subdata = 40
+
+        # making the most of data in subdata
+        # origins 2 bytes
+        # Gender(1) Ball(4) Game(4) Level(7)
+        # 0         0000    0000    0000000
+        # Rotate the bits, so that the gender bit moves from the highest bit to the lowest
+        # (No need to rotate bits to begin with, since we're starting with a 0 value)
+        # This gives us 8 bits at the start to work with, then 4 bits, then 4 bits we leave alone
+        # Rotate the bits back for storing in the pokemon
+        ###
+        # egg_iv_abaility 4 bytes
+        # 1111 1111 1111 1111 1111 1111 1111 1111
+        # ability egg  | ivs                                 |        
+        #                        | three bytes using already |
+        # 1       1    11 1111   1111 1111 1111 1111 1111 1111
+        # only egg is important, another 7 bits we can use
+
+        part_1 = hide_data[0:2]   # species id                      2
+        part_2a = hide_data[2:18]  # big section                    16
+        part_2b = hide_data[18:30]  # big section                   12
+        part_3 = hide_data[30:31] # met location                    1
+        part_4 = hide_data[31:32] # origins lower byte              1
+        part_5 = hide_data[32:35] # egg_iv_ability lower 3 bytes    3
+        part_6 = hide_data[35:39] # ribbons and obedience           4
+        part_7 = hide_data[39]    # extra byte we fit in            1
+        part_7_upper = (part_7 >> 4) & 0xF
+        part_7_lower = part_7 & 0xF
+        #
+        part_8 = hide_data[40:50]
+        part_9 = hide_data[50:57]
+        part_10 = hide_data[57:61]
+        part_11 = hide_data[61:65]
+        part_12 = hide_data[65:67]
+
+        temp = self.__subdata
+        temp[0:2] = part_1 # species id
+        temp[4:20] = part_2a # big section
+        temp[24:36] = part_2b # big section
+        temp[37:38] = part_3 # met location
+        # for origins, we set part_4 to the lower bytes
+        # then part_7_upper to the next 4 bits
+        origins_value = int.from_bytes(part_4, byteorder='little')
+        origins_value = origins_value | (part_7_upper << 8)
+        # Now, rotate bits by 1 so that the lowest is now the highest
+        origins_value = (origins_value >> 1) | (origins_value << (16 - 1)) & 0xFFFF
+        # set the value
+        temp[38:40] = origins_value.to_bytes(2, byteorder='little')
+
+        # part 5
+        temp[40:43] = part_5
+        # byte's value is 0, so we can just set to value. we set egg flag later on
+        temp[43] = part_7_lower
+        # part 6
+        temp[44:48] = part_6
+
+        self.__subdata = temp
+        self.egg = True
+
+        self.bytes_[8:18] = part_8
+        self.bytes_[20:27] = part_9
+        self.pid = int.from_bytes(part_10, byteorder='little')
+        self.otid = int.from_bytes(part_11, byteorder='little')
+        self.bytes_[30:32] = part_12
+    
+    def extract_secret_data(self):
+        all_hidden_data = bytearray()
+
+        part_1 = self.__subdata[0:2]   # species id
+        part_2a = self.__subdata[4:20]  # big section
+        part_2b = self.__subdata[24:36]  # big section
+        part_3 = self.__subdata[37:38] # met location
+        
+        origins_value = int.from_bytes(self.__subdata[38:40], byteorder='little')
+        # Rotate the bits, so that the gender bit moves from the highest bit to the lowest
+        origins_value = ((origins_value << 1) | (origins_value >> (16-1))) & 0xFFFF
+        # set part_4 to the lower byte
+        part_4 = origins_value & 0xFF
+        part_4 = part_4.to_bytes(1, byteorder='little')
+        # set part_7_upper to the next 4 bits after the first byte
+        part_7_upper = (origins_value >> 8) & 0xF
+        # and the lower part to the lower half of this byte
+        part_7_lower = self.__subdata[43] & 0xF
+        part_7 = ((part_7_upper << 4) | part_7_lower) & 0xFF
+        part_7 = part_7.to_bytes(1, byteorder='little')
+
+        part_5 = self.__subdata[40:43] 
+        part_6 = self.__subdata[44:48] 
+
+        # regular pokemon data, not subdata
+        part_8 = self.bytes_[8:18]
+        part_9 = self.bytes_[20:27]
+        part_10 = self.pid.to_bytes(4, byteorder='little')
+        part_11 = self.otid.to_bytes(4, byteorder='little')
+        part_12 = self.bytes_[30:32]
+        
+        
+        all_hidden_data.extend(part_1)
+        all_hidden_data.extend(part_2a)
+        all_hidden_data.extend(part_2b)
+        all_hidden_data.extend(part_3)
+        all_hidden_data.extend(part_4)
+        all_hidden_data.extend(part_5)
+        all_hidden_data.extend(part_6)
+        all_hidden_data.extend(part_7)
+        #
+        all_hidden_data.extend(part_8)
+        all_hidden_data.extend(part_9)
+        all_hidden_data.extend(part_10)
+        all_hidden_data.extend(part_11)
+        all_hidden_data.extend(part_12)
+
+        return all_hidden_data
+
+    @property
+    def pid(self):
+        return int.from_bytes(self.bytes_[0:4], byteorder='little')
+    @pid.setter
+    def pid(self, value):
+        # subdata encryption and the order of the 4 parts within
+        # depends on pid (and otid), so first get the decrypted subdata
+        subdata = self.__subdata
+        # then change the pid
+        self.bytes_[0:4] = value.to_bytes(4, byteorder='little')
+        # and then set the same subdata back, flush() encrypts it with the new key and in the new order
+        self.__subdata = subdata
+
+    @property
+    def otid(self):
+        return int.from_bytes(self.bytes_[4:8], byteorder='little')
+    @otid.setter
+    def otid(self, value):
+        # same idea as when we as change the pid
+        subdata = self.__subdata
+        self.bytes_[4:8] = value.to_bytes(4, byteorder='little')
+        self.__subdata = subdata
+
+    @property
+    def __subdata(self):
+        # nearly every getter and setter goes through here, so we only decrypt once
+        # and keep the decrypted subdata around until the pokemon is cleared
+        if self.__subdata_cache is None:
+            if stats.enabled:
+                stats.count('subdata_decrypts')
+            # take encrypted data which has four parts arranged in a top secret order
+            # decrypt, and put subdata parts into standardized order
+            self.__subdata_cache = decrypt_subdata(self.pid, self.otid, self.bytes_[32:80])
+        return self.__subdata_cache
+
+    @__subdata.setter
+    def __subdata(self, subdata):
+        # only keep the new subdata for now, encrypting and the checksum are done by flush()
+        self.__subdata_cache = subdata
+        self.__subdata_dirty = True
+        self.modified = True
+
+    def flush(self):
+        # write the cached subdata back to bytes_, save_block.commit() calls this for every pokemon
+        if not self.__subdata_dirty:
+            return
+        if stats.enabled:
+            stats.count('subdata_encrypts')
+        subdata = self.__subdata_cache
+        # encrypt, and arrange subdata parts back in the top secret order
+        # set back to pokemon data
+        self.bytes_[32:80] = encrypt_subdata(self.pid, self.otid, subdata)
+        # recalculate checksum
+        self.bytes_[28:30] = gen_subdata_checksum(subdata)
+        self.__subdata_dirty = False
+
+    @staticmethod
+    def flush_all(pokemon_list):
+        # same as calling flush() on every pokemon, but encrypts them all at once when numpy is available
+        dirty = [poke for poke in pokemon_list if poke.__subdata_dirty]
+        if len(dirty) < 2 or not codec.have_numpy():
+            for poke in dirty:
+                poke.flush()
+            return
+        subdata = codec.numpy.array([poke.__subdata_cache for poke in dirty], dtype=codec.numpy.uint8)
+        encrypted, checksums = encode_subdata_batch([poke.pid for poke in dirty], [poke.otid for poke in dirty], subdata)
+        for poke, encrypted_subdata, checksum in zip(dirty, encrypted.tolist(), checksums.tolist()):
+            poke.bytes_[32:80] = bytes(encrypted_subdata)
+            poke.bytes_[28:30] = checksum.to_bytes(2, byteorder='little')
+            poke.__subdata_dirty = False
+
+    @property
+    def species_id(self):
+        # the game's internal species id, see national_dex_id
+        return int.from_bytes(self.__subdata[0:2], byteorder='little')
+
+    @property
+    def national_dex_id(self):
+        return self.__internal_species_id_to_national_id(self.species_id)
+
+    @national_dex_id.setter
+    def national_dex_id(self, value):
+        # different pokemon level up at different rates
+        # most extreme example (I could find) if we don't adjust exp when changing the species:
+        # lv 100 Altaria would become a lv 75 Breloom
+
+        # get the current level, and exp needed to get to the next level
+        original_level = self.level
+        original_exp_to_next_level = self.__exp_to_next_level
+
+        # change pokemon species
+        internal_species_id = self.__national_id_to_internal_species_id(value)
+        self.__write_value_to_subdata(internal_species_id, 0, 2)
+
+        if original_level == 100:
+            self.level = original_level
+        else:
+            # if we used to be on level 50 with 30 exp until 51
+            # set to level 51, then subtract 30 exp so we are level 50
+            self.level = original_level + 1
+            adjusted_exp = self.exp - original_exp_to_next_level
+            # this has issues at lower levels, when the old distance to the
+            # next level is higher than the base exp for the level of the new species
+            # in that case, we set to the new level only
+            if adjusted_exp < 0:
+                self.level = original_level
+            else:
+                self.exp = adjusted_exp
+            
+            # similar to above, handling some rare cases where 
+            # we subtracted enough exp to take us down a level
+            if self.level < original_level:
+                self.level = original_level
+
+    @property
+    def egg(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 30)
+    @egg.setter
+    def egg(self, set_egg):
+        iv_egg_ability = int.from_bytes(self.__subdata[40:44], byteorder='little')
+        if set_egg:
+            iv_egg_ability = iv_egg_ability | (1 << 30)
+            self.bytes_[18:20] = (0x0601).to_bytes(2, byteorder='little')
+        else:
+            iv_egg_ability = iv_egg_ability & ~(1 << 30)
+            self.bytes_[18:20] = (0x0202).to_bytes(2, byteorder='little')
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+    
+    @property
+    def iv_hp(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        # to get the first 5 bits from this 32 bit value, we can & with 0b11111
+        # this ensures the maximum value we can is 0b11111
+        return iv_egg_ability & 0b11111
+    @iv_hp.setter
+    def iv_hp(self, value):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        # 1. For the HP IV, our attention is on the last 5 bits (separated for visibility)
+        #    111111111111111111111111111_11111
+        # 2. First we set these bits to 0:      num = num & ~(0b11111)
+        #    0b11111 is 31, all 5 bits set, the maximum value of an IV
+        #    We take the inverse of 31 so that we have a value that has all bits set to 1 apart from the last 5
+        #    ~(0b11111) = 111111111111111111111111111_00000
+        #    Take this and Bitwise AND with our initial value makes it so our value is never bigger than 111111111111111111111111111_00000
+        #    Now our value is the same as before, but with the HP IV set to 0
+        # 3. Now we can use Bitwise OR to set our desired HP IV:      num = num | hp_iv
+        iv_egg_ability &= ~31
+        iv_egg_ability |= value
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+
+    @property
+    def iv_atk(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 5) & 0b11111
+    @iv_atk.setter
+    def iv_atk(self, value):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        iv_egg_ability &= ~(31 << 5)
+        iv_egg_ability |= (value << 5)
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+
+    @property
+    def iv_def(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 10) & 0b11111
+    @iv_def.setter
+    def iv_def(self, value):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        iv_egg_ability &= ~(31 << 10)
+        iv_egg_ability |= (value << 10)
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+
+    @property
+    def iv_spd(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 15) & 0b11111
+    @iv_spd.setter
+    def iv_spd(self, value):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        iv_egg_ability &= ~(31 << 15)
+        iv_egg_ability |= (value << 15)
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+
+    @property
+    def iv_spatk(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 20) & 0b11111
+    @iv_spatk.setter
+    def iv_spatk(self, value):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        iv_egg_ability &= ~(31 << 20)
+        iv_egg_ability |= (value << 20)
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+
+    @property
+    def iv_spdef(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 25) & 0b11111
+    @iv_spdef.setter
+    def iv_spdef(self, value):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        iv_egg_ability &= ~(31 << 25)
+        iv_egg_ability |= (value << 25)
+        self.__write_value_to_subdata(iv_egg_ability, 0x28, 4)
+
+    @property
+    def iv_list(self):
+        return [self.iv_hp, self.iv_atk, self.iv_def, self.iv_spd, self.iv_spatk, self.iv_spdef]
+    @iv_list.setter
+    def iv_list(self, iv_list):
+        if len(iv_list) != 6:
+            raise ValueError('Needs 6 IVs')
+        if any([0 < x > 31 for x in iv_list]):
+            raise ValueError('IVs must be from 0 to 31')
+        [self.iv_hp, self.iv_atk, self.iv_def, self.iv_spd, self.iv_spatk, self.iv_spdef] = iv_list
+
+    @property
+    def ev_hp(self):
+        return self.__subdata[24]
+    @ev_hp.setter
+    def ev_hp(self, value):
+        self.__write_value_to_subdata(value, 24, 1)
+    
+    @property
+    def ev_atk(self):
+        return self.__subdata[25]
+    @ev_atk.setter
+    def ev_atk(self, value):
+        self.__write_value_to_subdata(value, 25, 1)
+
+    @property
+    def ev_def(self):
+        return self.__subdata[26]
+    @ev_def.setter
+    def ev_def(self, value):
+        self.__write_value_to_subdata(value, 26, 1)
+    
+    @property
+    def ev_spd(self):
+        return self.__subdata[27]
+    @ev_spd.setter
+    def ev_spd(self, value):
+        self.__write_value_to_subdata(value, 27, 1)
+
+    @property
+    def ev_spatk(self):
+        return self.__subdata[28]
+    @ev_spatk.setter
+    def ev_spatk(self, value):
+        self.__write_value_to_subdata(value, 28, 1)
+    
+    @property
+    def ev_spdef(self):
+        return self.__subdata[29]
+    @ev_spdef.setter
+    def ev_spdef(self, value):
+        self.__write_value_to_subdata(value, 29, 1)
+    
+    @property
+    def ev_list(self):
+        return [self.ev_hp, self.ev_atk, self.ev_def, self.ev_spd, self.ev_spatk, self.ev_spdef]
+    @ev_list.setter
+    def ev_list(self, ev_list):
+        if len(ev_list) != 6:
+            raise ValueError('Needs 6 EVs')
+        if any([0 < x > 255 for x in ev_list]):
+            raise ValueError('EVs must be from 0 to 255')
+        [self.ev_hp, self.ev_atk, self.ev_def, self.ev_spd, self.ev_spatk, self.ev_spdef] = ev_list
+
+    @property
+    def ability(self):
+        iv_egg_ability = int.from_bytes(self.__subdata[0x28:0x2C], byteorder='little')
+        return (iv_egg_ability >> 31) + 1
+    @ability.setter
+    def ability(self, value):
+        if (1 < value > 2):
+            raise ValueError('Ability can only be 1 or 2')
+        iv_egg_ability = int.from_bytes(self.__subdata[40:44], byteorder='little')
+        if value == 2:
+            iv_egg_ability = iv_egg_ability | (1 << 31)
+        else:
+            iv_egg_ability = iv_egg_ability & ~(1 << 31)
+        self.__write_value_to_subdata(iv_egg_ability, 40, 4)
+    
+    @property
+    def pokerus_days_left(self):
+        pokerus = self.__subdata[36]
+        return pokerus & 0xF
+    @pokerus_days_left.setter
+    def pokerus_days_left(self, value):
+        # when setting days left, max days is 4, and only for some strains
+        pokerus = self.__subdata[36]
+        pokerus = pokerus & ~(0xF)
+        pokerus |= value
+        self.__write_value_to_subdata(pokerus, 36, 1)
+
+    @property
+    def pokerus_strain(self):
+        pokerus = self.__subdata[36]
+        return pokerus >> 4
+    @pokerus_strain.setter
+    def pokerus_strain(self, value):
+        pokerus = self.__subdata[36]
+        pokerus = pokerus & ~(0xF << 4)
+        pokerus |= (value << 4)
+        self.__write_value_to_subdata(pokerus, 36, 1)
+    
+    @property
+    def pokerus(self):
+        if self.pokerus_strain and self.pokerus_days_left:
+            return 'Infected'
+        elif self.pokerus_strain:
+            return 'Cured'
+        else:
+            return False
+    # Might have noticed some issues, will verifiy again later
+    # @pokerus_strain.setter
+    # def pokerus_strain(self, value):
+    #     pokerus = self.__subdata[32]
+    #     pokerus = pokerus & ~(0xF << 4)
+    #     pokerus |= (value << 4)
+    #     temp = self.__subdata
+    #     temp[32] = pokerus
+    #     self.__subdata = temp
+
+    @property
+    def name(self):
+        return decode_name(self.bytes_[0x8 : 0x8+10])
+    
+    @name.setter
+    def name(self, text):
+        if len(text) > 10:
+            raise ValueError('Max name length is 10')
+        self.name_bytes = encode_names(text) if text else b'\xFF' * 10
+
+    @property
+    def name_bytes(self):
+        # the name as it is stored, names aren't in the encrypted subdata
+        return bytes(self.bytes_[0x8 : 0x8+10])
+
+    @name_bytes.setter
+    def name_bytes(self, name_bytes):
+        if len(name_bytes) != 10:
+            raise ValueError('Name bytes must be 10 bytes')
+        self.bytes_[0x8 : 0x8+10] = name_bytes
+        self.modified = True
+
+    @property
+    def held_item(self):
+        return int.from_bytes(self.__subdata[2:4], byteorder='little')
+    @held_item.setter
+    def held_item(self, value):
+        self.__write_value_to_subdata(value, 2, 2)
+
+    @property
+    def move_1(self):
+        return int.from_bytes(self.__subdata[12:14], byteorder='little')
+    @move_1.setter
+    def move_1(self, value):
+        self.__write_value_to_subdata(value, 12, 2)
+    
+    @property
+    def move_2(self):
+        return int.from_bytes(self.__subdata[14:16], byteorder='little')
+    @move_2.setter
+    def move_2(self, value):
+        self.__write_value_to_subdata(value, 14, 2)
+    
+    @property
+    def move_3(self):
+        return int.from_bytes(self.__subdata[16:18], byteorder='little')
+    @move_3.setter
+    def move_3(self, value):
+        self.__write_value_to_subdata(value, 16, 2)
+    
+    @property
+    def move_4(self):
+        return int.from_bytes(self.__subdata[18:20], byteorder='little')
+    @move_4.setter
+    def move_4(self, value):
+        self.__write_value_to_subdata(value, 18, 2)
+
+    @property
+    def move_list(self):
+        return [self.move_1, self.move_2, self.move_3, self.move_4]
+    @move_list.setter
+    def move_list(self, move_list):
+        [self.move_1, self.move_2, self.move_3, self.move_4] = move_list
+
+    @property
+    def exp(self):
+        return int.from_bytes(self.__subdata[4:8], byteorder='little')
+    @exp.setter
+    def exp(self, value):
+        self.__write_value_to_subdata(value, 4, 4)
+    
+    @property
+    def exp_type(self):
+        return exp_types[self.national_dex_id-1]
+
+    @property
+    def __exp_lookup_table(self):
+        return exp_tables[self.exp_type]
+    
+    @property
+    def __exp_to_next_level(self):
+        level = self.level
+        if level == 100:
+            return 0
+        # Level starts at 1 but arrays start at 0, so using level 1 to get the index
+        # will return the 2nd element (level 2), the total exp to be at level 2
+        next_level_exp =  self.__exp_lookup_table[level]
+        return next_level_exp - self.exp
+
+    @property
+    def level(self):
+        exp_table = self.__exp_lookup_table
+        exp = self.exp
+        # if we have the max exp (or more), we're at level 100
+        if exp >= exp_table[-1]:
+            # in case exp was above max for exp type, set to max
+            if exp > exp_table[-1]:
+                self.exp = exp_table[-1]
+            return 100
+        return level_from_exp(exp_table, exp)
+
+    @level.setter
+    def level(self, level):
+        if (1 < level > 100):
+            raise ValueError('Level must be from 1 to 100')
+        self.exp = self.__exp_lookup_table[level-1]
+
+    def record(self):
+        # every field at once, from one decrypted subdata, for exporting (see export.py) and printing
+        # reading a record never changes the pokemon, unlike level which caps exp
+        species_id, held_item, exp, *fields = subdata_fields.unpack(self.__subdata)
+        pokerus, iv_egg_ability = fields[10:12]
+        national_id = internal_to_national[species_id] if species_id < len(internal_to_national) else 0
+        if pokerus >> 4 and pokerus & 0xF:
+            pokerus = 'Infected'
+        elif pokerus >> 4:
+            pokerus = 'Cured'
+        else:
+            pokerus = False
+        return {
+            'species': national_id,
+            'name': self.name,
+            'egg': bool(iv_egg_ability >> 30 & 1),
+            'level': level_from_species_exp(national_id, exp),
+            'exp': exp,
+            'ivs': [iv_egg_ability >> shift & 0b11111 for shift in range(0, 30, 5)],
+            'evs': fields[4:10],
+            'moves': fields[0:4],
+            'item': held_item,
+            'pid': self.pid,
+            'otid': self.otid,
+            'ability': (iv_egg_ability >> 31) + 1,
+            'pokerus': pokerus,
+        }
+
+    def update(self, **fields):
+        # sets several fields at once, named as in record(): ivs, evs, moves, item, exp, level and ability
+        # every value is checked before anything changes (see check_update_fields), then they are all written to the
+        # decrypted subdata, which flush() (or save_block.commit()) encrypts and checksums once
+        check_update_fields(fields)
+        subdata = self.__subdata
+        iv_egg_ability = int.from_bytes(subdata[40:44], byteorder='little')
+        writes = []
+        for field, value in fields.items():
+            if field == 'ivs':
+                iv_egg_ability &= ~0x3FFFFFFF
+                for shift, iv in zip(range(0, 30, 5), value):
+                    iv_egg_ability |= iv << shift
+            elif field == 'ability':
+                iv_egg_ability = (iv_egg_ability & ~(1 << 31)) | ((value - 1) << 31)
+            elif field == 'evs':
+                writes.append((24, bytes(value)))
+            elif field == 'moves':
+                writes.append((12, b''.join(move.to_bytes(2, byteorder='little') for move in value)))
+            elif field == 'item':
+                writes.append((2, value.to_bytes(2, byteorder='little')))
+            elif field == 'exp':
+                writes.append((4, value.to_bytes(4, byteorder='little')))
+            elif field == 'level':
+                # the only check that depends on the pokemon
+                species_id = int.from_bytes(subdata[0:2], byteorder='little')
+                national_id = internal_to_national[species_id] if species_id < len(internal_to_national) else 0
+                if not 0 < national_id <= len(exp_types):
+                    raise ValueError('Level can only be set for a known species')
+                writes.append((4, exp_tables[exp_types[national_id-1]][value-1].to_bytes(4, byteorder='little')))
+        writes.append((40, iv_egg_ability.to_bytes(4, byteorder='little')))
+        for position, value in writes:
+            subdata[position : position+len(value)] = value
+        self.__subdata = subdata
+
+    def __str__(self):
+        from .data import item_list
+        indent = ' ' * 4
+        if self.is_clear():
+            return f'{indent}-'
+        record = self.record()
+        lines = [
+            f'Name:   {record["name"]}',
+            f'Egg:    {record["egg"]}',
+            f'Nat ID: {record["species"]}',
+            f'OTID:   {record["otid"]}',
+            f'PID:    {record["pid"]}',
+            f'Abil:   {record["ability"]}',
+            f'IVs:    {record["ivs"]}',
+            f'EVs:    {record["evs"]}',
+            f'Item:   {item_list[record["item"]] if record["item"] > 0 else "None"}',
+            f'Moves:  {record["moves"]}',
+            f'PKRS:   {record["pokerus"]}',
+        ]
+        return '\n'.join(indent + line for line in lines)
+
+def check_update_fields(fields):
+    # raises ValueError for a field pokemon.update() doesn't know, or a value out of range
+    # none of these depend on the pokemon, so many pokemon can be checked once
+    for field, value in fields.items():
+        if field == 'ivs':
+            if len(value) != 6:
+                raise ValueError('Needs 6 IVs')
+            if any(not 0 <= x <= 31 for x in value):
+                raise ValueError('IVs must be from 0 to 31')
+        elif field == 'ability':
+            if value not in (1, 2):
+                raise ValueError('Ability can only be 1 or 2')
+        elif field == 'evs':
+            if len(value) != 6:
+                raise ValueError('Needs 6 EVs')
+            if any(not 0 <= x <= 255 for x in value):
+                raise ValueError('EVs must be from 0 to 255')
+        elif field == 'moves':
+            if len(value) != 4:
+                raise ValueError('Needs 4 moves')
+            if any(not 0 <= x <= 0xFFFF for x in value):
+                raise ValueError('Moves must be from 0 to 65535')
+        elif field == 'item':
+            if not 0 <= value <= 0xFFFF:
+                raise ValueError('Item must be from 0 to 65535')
+        elif field == 'exp':
+            if not 0 <= value <= 0xFFFFFFFF:
+                raise ValueError('Exp must be from 0 to 4294967295')
+        elif field == 'level':
+            if not 1 <= value <= 100:
+                raise ValueError('Level must be from 1 to 100')
+        else:
+            raise ValueError(f'Unknown field: {field}')
+
+# what a cell in the boxes holds, see save_block.occupancy
+slot_empty = 0
+slot_egg = 1
+slot_pokemon = 2
+
+# amount of data in each section, by section id
+section_size_lookup = (0xf2c, 0xf80, 0xf80, 0xf80, 0xf08, 0xf80, 0xf80, 0xf80, 0xf80, 0xf80, 0xf80, 0xf80, 0xf80, 0x7d0)
+
+class save_section:
+
+    def __init__(self, section_bytes):
+        self.bytes_ = section_bytes
+        # checksumming a section is slow, so valid is only worked out once
+        # call invalidate() after changing bytes_ without going through fix_checksum()
+        self.__valid = None
+    
+    @property
+    def id(self):
+        section_id_bytes = self.bytes_[0xff4 : 0xff4 + 0x2]
+        return int.from_bytes(section_id_bytes, byteorder='little')
+    
+    @property
+    def index(self):
+        section_index_bytes = self.bytes_[0xffc : 0xff4c + 0x4]
+        return int.from_bytes(section_index_bytes, byteorder='little') 
+    
+    # amount of data to use when calculating checksum
+    @property
+    def size(self):
+        return section_size_lookup[self.id]
+
+    # the checksum that currently resides in section
+    @property
+    def existing_checksum(self):
+        section_checksum_bytes = self.bytes_[0xff6 : 0xff6 + 0x2]
+        return int.from_bytes(section_checksum_bytes, byteorder='little')
+
+    
+    def calculate_checksum(self):
+        if stats.enabled:
+            stats.count('checksums')
+            stats.count('checksum_bytes', self.size)
+        return section_checksum(self.bytes_[0:self.size])
+        
+    def fix_checksum(self):
+        checksum = self.calculate_checksum()
+        self.bytes_[0xff6 : 0xff6 + 0x2] = checksum.to_bytes(2, byteorder='little')
+        self.__valid = True
+    
+    @property
+    def valid(self):
+        if self.__valid is None:
+            self.__valid = self.existing_checksum == self.calculate_checksum()
+        return self.__valid
+
+    def invalidate(self):
+        self.__valid = None
+
+class save_block:
+
+    def __init__(self, save_bytes):
+        self.bytes_ = save_bytes
+        self.__sections = []
+
+        # where each pc buffer starts and ends in box_data, (section id, start, end)
+        self.__pc_buffer_ranges = []
+        self.box_data = bytearray()
+        self.pokemon_list = []
+
+        # ids of the sections that changed since the last commit, only these get rewritten
+        self.__dirty_sections = set()
+
+        # valid and index only change when the sections do, see invalidate()
+        self.__valid = None
+        self.__index = None
+
+        # see occupancy
+        self.__occupancy = None
+
+        self.__read_sections()
+        self.__build_pokemon_list()
+
+    @property
+    def valid(self):
+        if self.__valid is None:
+            self.__valid = all([section.valid for section in self.__sections])
+        return self.__valid
+    
+    @property
+    def index(self):
+        if self.__index is None:
+            self.__index = self.__find_index()
+        return self.__index
+
+    def __find_index(self):
+        # a save block doesn't have an index, but we will go through all sections
+        # and make sure all indexes are the same, and use that as the index for the block
+        check_index = self.__sections[0].index
+        if all([check_index == section.index for section in self.__sections]):
+            return check_index
+        else:
+            print('Not all section indexes are equal!')
+
+    def invalidate(self):
+        # forget valid and index, for when section bytes were changed outside of commit()
+        self.__valid = None
+        self.__index = None
+        for section in self.__sections:
+            section.invalidate()
+           
+    def __build_pokemon_list(self):
+        # saves don't necessarily have the sections in the correct order, 
+        # so first we will add box data to a dict and then access it once save is fully parsed
+        pc_buffers = {}
+        for section in self.__sections:
+            if section.id >= 5:
+                pc_buffers[section.id] = section.bytes_[0 : section.size]
+
+        # the box data is spread over several sections, so unlike everything else it is a copy
+        for bank in sorted(pc_buffers.keys()):
+            start = len(self.box_data)
+            self.box_data.extend(pc_buffers[bank])
+            self.__pc_buffer_ranges.append((bank, start, len(self.box_data)))
+        if len(self.box_data) != 33744:
+            print(f'Error Box data size!: {len(self.box_data)}')
+
+        # decrypting all pokemon at once is a lot faster than each pokemon doing its own
+        box_subdata = [None] * 420
+        if codec.have_numpy():
+            box_subdata = [bytearray(subdata) for subdata in decode_subdata_batch(self.box_data[0x0004:0x8344])]
+        # 420 pokemon in the box data, each has 80 bytes
+        # each pokemon reads and writes box_data directly, so box_data can't change size from here on
+        for i in range(420):
+            this_pokemon = pokemon(self.box_data, box_subdata[i], 0x0004 + (i * 80))
+            self.pokemon_list.append(this_pokemon)
+        
+    def __write_pokemon_list(self):
+        pokemon.flush_all(self.pokemon_list)
+        # the pokemon already changed box_data, we only need to know which parts
+        # box names, wallpaper, and current box is left as is
+        for i, poke in enumerate(self.pokemon_list):
+            if poke.modified:
+                start = 0x0004 + (i * 80)
+                self.mark_box_data_dirty(start, start+80)
+                self.update_occupancy(i)
+                poke.modified = False
+
+    @property
+    def occupancy(self):
+        # slot_empty, slot_egg or slot_pokemon for each of the 420 cells, one byte each
+        # read from box_data (the egg flag isn't encrypted), so nothing is decrypted
+        # it is built the first time it's used, then steg and commit() keep it up to date
+        # call update_occupancy() after changing a pokemon and not committing
+        if self.__occupancy is None:
+            self.__occupancy = bytearray(self.__slot_state(i) for i in range(420))
+        return self.__occupancy
+
+    def __slot_state(self, index):
+        start = 0x0004 + (index * 80)
+        # flags byte, bit 2 is the egg flag
+        if self.box_data[start+19] & 4:
+            return slot_egg
+        if any(self.box_data[start : start+32]):
+            return slot_pokemon
+        # only the subdata can tell, and changes to it only reach box_data once flushed
+        self.pokemon_list[index].flush()
+        return slot_pokemon if any(self.box_data[start+32 : start+80]) else slot_empty
+
+    def update_occupancy(self, index):
+        if self.__occupancy is not None:
+            self.__occupancy[index] = self.__slot_state(index)
+
+    def empty_slots(self):
+        # indexes into pokemon_list of the empty cells
+        return [i for i, state in enumerate(self.occupancy) if state == slot_empty]
+
+    def egg_slots(self):
+        # indexes into pokemon_list of the eggs
+        return [i for i, state in enumerate(self.occupancy) if state == slot_egg]
+
+    def mark_box_data_dirty(self, start, end):
+        # call after changing box_data[start:end] directly, so commit() writes it back
+        for bank, bank_start, bank_end in self.__pc_buffer_ranges:
+            if start < bank_end and end > bank_start:
+                self.__dirty_sections.add(bank)
+
+    def mark_section_dirty(self, section_id):
+        # call after changing a section's bytes_ directly, so commit() fixes its checksum and writes it back
+        self.__dirty_sections.add(section_id)
+
+    def __read_sections(self):
+        # sections are views into the block's bytes, so changing a section changes the block
+        block_view = memoryview(self.bytes_)
+        for i in range(14):
+            section_data = block_view[i*0x1000 : i*0x1000+0x1000]
+            this_section = save_section(section_data)
+            self.__sections.append( this_section )
+
+    def __rebuild_sections(self):
+        # only sections that changed are rewritten, returns the positions of those sections in the block
+        # the only sections we need to manage now are the pokemon box data ones
+        # the other sections already contain their data
+        pc_buffer_ranges = {bank: (start, end) for bank, start, end in self.__pc_buffer_ranges}
+        rewritten = []
+        for i, section in enumerate(self.__sections):
+            if section.id not in self.__dirty_sections:
+                continue
+            if section.id >= 5:
+                start, end = pc_buffer_ranges[section.id]
+                section.bytes_[0 : section.size] = self.box_data[start:end]
+
+            # sections are views into the block, so this also updates the block's bytes
+            section.fix_checksum()
+            rewritten.append(i)
+        self.__dirty_sections.clear()
+        return rewritten
+   
+    def commit(self):
+        # build the pc buffer (sections 5 and onwards) from box data
+        self.__write_pokemon_list()
+        
+        # write pc buffers to sections
+        # rebuild this class (save_block)'s bytes with all of bytes from each section that changed
+        rewritten = self.__rebuild_sections()
+        if rewritten:
+            # the changed section checksums were just fixed, so only these need working out again
+            self.__valid = None
+            self.__index = None
+        return rewritten
+
+    def species_ids(self):
+        # national id of every pokemon in the boxes, worked out for all of them at once
+        # 0 for empty cells and species ids with no national id
+        if codec.use_numpy and codec.have_numpy():
+            pokemon.flush_all(self.pokemon_list)
+            subdata = decode_subdata_batch(b''.join(p.bytes_ for p in self.pokemon_list))
+            internal_ids = subdata[:, 0:2].copy().view('<u2')[:, 0]
+        else:
+            internal_ids = [p.species_id for p in self.pokemon_list]
+        return internal_to_national_ids(internal_ids)
+
+    def species_histogram(self):
+        # how many of each species (national id) are in the boxes, empty cells are left out
+        histogram = {}
+        for national_id in self.species_ids():
+            if national_id:
+                histogram[national_id] = histogram.get(national_id, 0) + 1
+        return histogram
+
+    def names(self):
+        # the name of every pokemon in the boxes, decoded all at once
+        # names aren't encrypted, so they are read straight from box_data
+        box_data = self.box_data
+        return decode_names(b''.join([box_data[i+0x8 : i+0x8+10] for i in range(0x0004, 0x8344, 80)]))
+
+    def find_species(self, national_id):
+        # indexes into pokemon_list of every pokemon of this species
+        return [i for i, this_id in enumerate(self.species_ids()) if this_id == national_id]
+
+    def hide_secret_data(self, secret_data, delta=False):
+        return steg.hide_secret_data(self, secret_data, delta)
+
+    def hide_payload(self, data_pieces, compression='zlib', level=None, digest_kind='crc32', delta=False, parity=0):
+        return steg.hide_payload(self, data_pieces, compression, level, digest_kind, delta, parity)
+
+    def hide_placed(self, data_pieces, compression='none', level=None, digest_kind='crc32', delta=False, empty_only=True, boxes=None, layout='contiguous'):
+        return steg.hide_placed(self, data_pieces, compression, level, digest_kind, delta, empty_only, boxes, layout)
+
+    def extract_secret_data(self):
+        return steg.extract_secret_data(self)
+
+    def verify_secret_data(self, secret_data):
+        return steg.verify_secret_data(self, secret_data)
+
+    def check_payload(self, repairs=None):
+        return steg.check_payload(self, repairs)
+
+    def repair_payload(self):
+        return steg.repair_payload(self)
+
+    def string_to_names(self, input_string):
+        steg.string_to_names(self, input_string)
+
+    def names_to_string(self):
+        return steg.names_to_string(self)
+
+    def release(self):
+        # let go of the views into the save bytes, needed before a memory mapped save can be closed
+        for section in self.__sections:
+            section.bytes_.release()
+        if isinstance(self.bytes_, memoryview):
+            self.bytes_.release()
+
+class save:
+
+    def __init__(self, save_bytes):
+        # save_bytes can be anything writable that supports the buffer protocol, a bytearray or an mmap
+        # the blocks and their sections are views into it, so they are never copied
+        # and committing writes straight into save_bytes
+        self.__bytes = save_bytes
+        self.__view = memoryview(save_bytes)
+        self.saveA = save_block(self.__view[0: 0xE000])
+        self.saveB = save_block(self.__view[0xE000: 0x1C000])
+        # which block is the active one only changes when a block does, see invalidate()
+        self.__active_save = None
+
+    @property
+    def active_save(self):
+        if self.__active_save is None:
+            self.__active_save = self.__find_active_save()
+        return self.__active_save
+
+    def __find_active_save(self):
+        # If saveA is more recent than B
+        if self.saveA.index >= self.saveB.index:
+            if self.saveA.valid:
+                return self.saveA
+            elif self.saveB.valid:
+                return self.saveB
+        else:
+            if self.saveB.valid:
+                return self.saveB
+            elif self.saveA.valid:
+                return self.saveA
+        raise ValueError('No valid save blocks!')
+
+    @property
+    def backup_save(self):
+        if self.active_save == self.saveA:
+            return self.saveB
+        return self.saveA
+
+    def get_bytes(self):
+        return self.__bytes
+
+    def invalidate(self):
+        # forget which block is active, for when section bytes were changed outside of commit()
+        self.saveA.invalidate()
+        self.saveB.invalidate()
+        self.__active_save = None
+    
+    # Call commit method that will trickle down each part of the save
+    # and make sure the bytes are up to date, finalizing the save
+    def commit(self):
+        # the blocks are views into our bytes, so there is nothing to copy back
+        rewritten_a = self.saveA.commit()
+        rewritten_b = self.saveB.commit()
+        if rewritten_a or rewritten_b:
+            # committing fixes checksums, which can change which block is valid
+            self.__active_save = None
+
+    def flush(self):
+        # for a memory mapped save, make sure committed changes are written to the file
+        if isinstance(self.__bytes, mmap.mmap):
+            self.__bytes.flush()
+
+    def close(self):
+        # for a memory mapped save, unmap the file, the save can't be used after this
+        self.saveA.release()
+        self.saveB.release()
+        self.__view.release()
+        if isinstance(self.__bytes, mmap.mmap):
+            self.__bytes.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def mmap_save(save_path):
+    # opens a save file memory mapped, instead of reading it all into memory
+    # commit() then changes the file in place, flush() makes sure it's written to disk
+    #   with mmap_save('emerald.sav') as pokemon_save:
+    #       pokemon_save.active_save.hide_secret_data(data)
+    #       pokemon_save.commit()
+    #       pokemon_save.flush()
+    with open(save_path, 'r+b') as fh:
+        mapped = mmap.mmap(fh.fileno(), 0)
+    if len(mapped) != 131072:
+        mapped.close()
+        raise ValueError('Save data is the wrong size.')
+    return save(mapped)
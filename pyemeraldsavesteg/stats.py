@@ -0,0 +1,54 @@
+# opt-in counters and timers, to see where the time in a run goes
+# nothing is counted unless collecting, the hooks in hot code are guarded by `if stats.enabled:`
+#
+#   with pyemeraldsavesteg.stats.collecting() as report:
+#       ...
+#   print(report)
+#
+# report['counters'] counts subdata decrypts and encrypts, checksums and bytes checksummed, and pokemon built
+# report['seconds'] is the wall time of each phase (read, parse, active_save, store, commit, write, ...)
+# the time of a phase inside another phase is only counted for the inner one
+
+import time
+from contextlib import contextmanager
+
+enabled = False
+counters = {}
+seconds = {}
+# time spent in phases within each phase that is running, innermost last
+phase_stack = []
+
+def count(name, amount=1):
+    counters[name] = counters.get(name, 0) + amount
+
+@contextmanager
+def phase(name):
+    if not enabled:
+        yield
+        return
+    phase_stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        inner = phase_stack.pop()
+        seconds[name] = seconds.get(name, 0.0) + elapsed - inner
+        if phase_stack:
+            phase_stack[-1] += elapsed
+
+@contextmanager
+def collecting():
+    # the report is filled in as the run goes, and is complete once the with block ends
+    global enabled, counters, seconds
+    previous = (enabled, counters, seconds)
+    enabled = True
+    counters = {}
+    seconds = {}
+    report = {'counters': counters, 'seconds': seconds}
+    start = time.perf_counter()
+    try:
+        yield report
+    finally:
+        report['total_seconds'] = time.perf_counter() - start
+        enabled, counters, seconds = previous
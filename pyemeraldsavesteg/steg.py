@@ -0,0 +1,652 @@
+# hiding data in the pokemon of a save_block
+
+import binascii
+import importlib
+import math
+import struct
+import zlib
+from collections import namedtuple
+
+from .codec import encode_names, name_length, text_chars
+
+bytes_per_poke = 67
+
+def write_chunk(block, pokemon_index, chunk, delta=False):
+    # with delta, an egg already holding this chunk is left alone, so its pokemon and section aren't rewritten
+    # returns whether the egg was written
+    chunk = bytearray(chunk)
+    if len(chunk) < bytes_per_poke:
+        # padding with 0s, if the final pokemon/chunk needs it
+        chunk.extend([0] * (bytes_per_poke - len(chunk)))
+    this_pokemon = block.pokemon_list[pokemon_index]
+    if delta and not this_pokemon.is_clear() and this_pokemon.egg and this_pokemon.extract_secret_data() == chunk:
+        return False
+    this_pokemon.hide_secret_data(chunk)
+    block.update_occupancy(pokemon_index)
+
+    # make sure we can read back the same data
+    check_chunk = block.pokemon_list[pokemon_index].extract_secret_data()
+    for x in range(bytes_per_poke):
+        if chunk[x] != check_chunk[x]:
+            raise ValueError('Error: Data returned is not data written.')
+    return True
+
+def hide_secret_data(block, secret_data, delta=False):
+    needed_pokemon = math.ceil(len(secret_data)/bytes_per_poke)
+    if needed_pokemon > len(block.pokemon_list):
+        raise ValueError('Not enough room to write this data!')
+
+    # start with last pokemon in last box, work backwards
+    # returns how many eggs were written, fewer than needed_pokemon with delta when some already held their chunk
+    # sequenced eggs of a payload stored before would be found instead of this, they are looked for
+    # before writing, which can overwrite their header egg
+    old_slots = sequenced_slots(block)
+    pokemon_index = len(block.pokemon_list) - 1
+    written = 0
+    for i in range(0, len(secret_data), bytes_per_poke):
+        written += write_chunk(block, pokemon_index, secret_data[i:i+bytes_per_poke], delta)
+        pokemon_index -= 1
+    clear_eggs(block, old_slots - set(range(pokemon_index + 1, len(block.pokemon_list))))
+    return written
+
+# payloads with a header
+# the first egg (last cell in box 14) holds a header instead of data, the data follows in the eggs before it
+# so extracting knows exactly how many eggs to read, how to decompress them, and can check what it read
+#   4 bytes  magic, b'PESF'
+#   1 byte   header version
+#   1 byte   compression, see compressions
+#   1 byte   compression level, 0xFF for the default
+#   4 bytes  length of the original data
+#   4 bytes  length of the stored (compressed) data
+# version 2 adds
+#   1 byte   digest, see digests
+#   32 bytes digest of the original data, padded with 0s
+# version 3 (only written when there are parity eggs) adds
+#   1 byte   parity group size, see below
+# version 4 is the same as version 2, for sequenced eggs (see hide_placed), where the header is in egg 0 instead
+payload_magic = b'PESF'
+payload_version = 2
+payload_header = struct.Struct('<4sBBBII')
+payload_digest = struct.Struct('<B32s')
+payload_parity = struct.Struct('<B')
+payload_info = namedtuple('payload_info', 'version compression level original_length stored_length digest_kind digest parity slots')
+layouts = ['contiguous', 'scattered']
+compressions = ['none', 'zlib', 'lzma', 'bz2']
+digests = ['crc32', 'blake2']
+
+class no_compression:
+    # stands in for a compressor or decompressor when the data isn't compressed
+    def compress(self, data):
+        return data
+    def decompress(self, data):
+        return data
+    def flush(self):
+        return b''
+
+class crc32_digest:
+    # same interface as the hashlib objects
+    def __init__(self):
+        self.crc = 0
+    def update(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+    def digest(self):
+        return struct.pack('<I', self.crc)
+
+def make_digest(digest_kind):
+    if digest_kind == 'crc32':
+        return crc32_digest()
+    # hashlib takes a few ms to import, only do that when it's used
+    import hashlib
+    return hashlib.blake2b(digest_size=32)
+
+# levels each compression takes, the level is stored in one byte of the header
+compression_levels = {'none': range(0), 'zlib': range(0, 10), 'lzma': range(0, 10), 'bz2': range(1, 10)}
+
+def make_compressor(compression, level=None):
+    if level is not None and level not in compression_levels[compression]:
+        levels = compression_levels[compression]
+        if not levels:
+            raise ValueError(f'Compression {compression} has no level')
+        raise ValueError(f'Compression level for {compression} must be from {levels[0]} to {levels[-1]}')
+    if compression == 'none':
+        return no_compression()
+    # lzma and bz2 are only imported when used
+    module = importlib.import_module(compression)
+    if compression == 'zlib':
+        return module.compressobj(-1 if level is None else level)
+    if compression == 'lzma':
+        return module.LZMACompressor(preset=level)
+    return module.BZ2Compressor(9 if level is None else level)
+
+def make_decompressor(compression):
+    if compression == 'none':
+        return no_compression()
+    module = importlib.import_module(compression)
+    if compression == 'zlib':
+        return module.decompressobj()
+    if compression == 'lzma':
+        return module.LZMADecompressor()
+    return module.BZ2Decompressor()
+
+# parity eggs
+# with a parity group size, each egg holds 65 bytes of data and a CRC16 of them (seeded with the egg's number in the data),
+# and every group of that many eggs is followed by a parity egg, the XOR of the group's eggs
+# reading finds a damaged egg by its CRC, and rebuilds it from the rest of its group and the parity egg,
+# so one damaged egg in each group can be repaired without the original file
+parity_chunk_size = bytes_per_poke - 2
+
+def egg_crc(chunk, number):
+    # inverted, otherwise an egg of all 0s (like a cleared pokemon) would pass as egg number 0
+    return binascii.crc_hqx(chunk, number & 0xFFFF) ^ 0xFFFF
+
+def parity_frame(chunk, number):
+    chunk = bytes(chunk).ljust(parity_chunk_size, b'\0')
+    return chunk + egg_crc(chunk, number).to_bytes(2, byteorder='little')
+
+def parity_frame_ok(frame, number):
+    return egg_crc(frame[0:parity_chunk_size], number) == int.from_bytes(frame[parity_chunk_size:bytes_per_poke], byteorder='little')
+
+def xor_frames(frames):
+    result = 0
+    for frame in frames:
+        result ^= int.from_bytes(frame, byteorder='little')
+    return result.to_bytes(bytes_per_poke, byteorder='little')
+
+class egg_writer:
+    # writes data to eggs as it comes in, 67 bytes at a time, working backwards from pokemon_index
+    # with parity, 65 bytes at a time with a parity egg after every parity eggs, see parity_frame
+
+    def __init__(self, block, pokemon_index, delta=False, parity=0):
+        self.block = block
+        self.pokemon_index = pokemon_index
+        self.delta = delta
+        self.parity = parity
+        self.chunk_size = parity_chunk_size if parity else bytes_per_poke
+        self.buffer = bytearray()
+        self.written = 0
+        self.eggs = 0
+        self.eggs_written = 0
+        self.frames = 0
+        self.group = []
+
+    def __write_egg(self, chunk):
+        if self.pokemon_index < 0:
+            raise ValueError('Not enough room to write this data!')
+        self.eggs_written += write_chunk(self.block, self.pokemon_index, chunk, self.delta)
+        self.pokemon_index -= 1
+        self.eggs += 1
+
+    def __write_chunk(self, chunk):
+        if not self.parity:
+            self.__write_egg(chunk)
+            return
+        frame = parity_frame(chunk, self.frames)
+        self.__write_egg(frame)
+        self.frames += 1
+        self.group.append(frame)
+        if len(self.group) == self.parity:
+            self.__write_parity()
+
+    def __write_parity(self):
+        self.__write_egg(xor_frames(self.group))
+        self.group = []
+
+    def write(self, data):
+        self.buffer.extend(data)
+        self.written += len(data)
+        start = 0
+        while len(self.buffer) - start >= self.chunk_size:
+            self.__write_chunk(self.buffer[start:start+self.chunk_size])
+            start += self.chunk_size
+        del self.buffer[:start]
+
+    def close(self):
+        if self.buffer:
+            self.__write_chunk(self.buffer)
+            self.buffer = bytearray()
+        if self.group:
+            # the last group can be smaller
+            self.__write_parity()
+        return self.written
+
+def hide_payload(block, data_pieces, compression='zlib', level=None, digest_kind='crc32', delta=False, parity=0):
+    # data_pieces is any iterable of bytes, like a file being read in blocks,
+    # so the data is compressed and written to eggs without having all of it in memory
+    # with parity (1-255), a parity egg is added after every parity data eggs
+    # returns a dict of how much was stored
+    if not 0 <= parity <= 255:
+        raise ValueError('Parity group size must be from 1 to 255')
+    compressor = make_compressor(compression, level)
+    digest = make_digest(digest_kind)
+    first_index = len(block.pokemon_list) - 1
+    # as for hide_secret_data, sequenced eggs stored before are looked for first and cleared afterwards
+    old_slots = sequenced_slots(block)
+    writer = egg_writer(block, first_index - 1, delta, parity)
+    original_length = 0
+    for data in data_pieces:
+        original_length += len(data)
+        digest.update(data)
+        writer.write(compressor.compress(data))
+    writer.write(compressor.flush())
+    stored_length = writer.close()
+
+    # the header is written last, now that the lengths are known
+    # version 2 is kept when there is no parity, so versions that don't know about parity can still read it
+    header = payload_header.pack(payload_magic, 3 if parity else payload_version, compressions.index(compression), 0xFF if level is None else level, original_length, stored_length)
+    header += payload_digest.pack(digests.index(digest_kind), digest.digest())
+    if parity:
+        header += payload_parity.pack(parity)
+    eggs_written = writer.eggs_written + write_chunk(block, first_index, header, delta)
+    clear_eggs(block, old_slots - set(range(writer.pokemon_index + 1, len(block.pokemon_list))))
+
+    eggs = 1 + writer.eggs
+    return {
+        'compression': compression,
+        'digest': digest_kind,
+        'original_length': original_length,
+        'stored_length': stored_length,
+        'eggs': eggs,
+        'eggs_written': eggs_written,
+        'parity_eggs': math.ceil(writer.frames / parity) if parity else 0,
+        'bytes_per_egg': original_length / eggs,
+    }
+
+def parse_payload_header(header):
+    # returns a payload_info, or None if header isn't one
+    magic, version, compression, level, original_length, stored_length = payload_header.unpack_from(header)
+    if magic != payload_magic or version not in (1, 2, 3, 4) or compression >= len(compressions):
+        return None
+    if version == 1:
+        # no digest before version 2, only the length is checked
+        return payload_info(version, compressions[compression], level, original_length, stored_length, None, None, 0, None)
+    digest_kind, digest = payload_digest.unpack_from(header, payload_header.size)
+    if digest_kind >= len(digests):
+        return None
+    digest_kind = digests[digest_kind]
+    digest = digest[0:len(make_digest(digest_kind).digest())]
+    parity = 0
+    if version == 3:
+        (parity,) = payload_parity.unpack_from(header, payload_header.size + payload_digest.size)
+    return payload_info(version, compressions[compression], level, original_length, stored_length, digest_kind, digest, parity, None)
+
+# sequenced eggs, for payloads stored with a placement (see hide_placed)
+# each egg holds 63 bytes of data, then its sequence number and a CRC16 of the data (see egg_crc)
+# egg 0 holds the header (version 4), the stored data follows from egg 1
+# so the eggs can be in any cells, and still be read back after they've been moved around
+# the CRC of a data egg is seeded with its number and a key made from the header, so eggs left over from
+# another payload don't pass as this one's
+# the number and CRC end up in the unencrypted part of the pokemon (the top of the OTID, and bytes 30-32),
+# so looking for sequenced eggs only decrypts the eggs whose number could be one
+sequence_frame = struct.Struct('<HH')
+sequence_chunk_size = bytes_per_poke - sequence_frame.size
+
+def sequence_key(header_frame):
+    return binascii.crc_hqx(header_frame[0:sequence_chunk_size], 0)
+
+def make_sequence_frame(chunk, number, key=0):
+    chunk = bytes(chunk).ljust(sequence_chunk_size, b'\0')
+    return chunk + sequence_frame.pack(number, egg_crc(chunk, number ^ key))
+
+def sequence_frame_ok(frame, key=0):
+    number, crc = sequence_frame.unpack_from(frame, sequence_chunk_size)
+    return egg_crc(frame[0:sequence_chunk_size], number ^ key) == crc
+
+def find_sequenced_eggs(block):
+    # (sequence number, pokemon index, egg data) of every egg whose number could be a sequence number, not checked yet
+    found = []
+    for pokemon_index in block.egg_slots():
+        this_pokemon = block.pokemon_list[pokemon_index]
+        number = int.from_bytes(this_pokemon.bytes_[6:8], byteorder='little')
+        if number < len(block.pokemon_list):
+            found.append((number, pokemon_index, this_pokemon.extract_secret_data()))
+    return found
+
+def find_sequenced_payload(block):
+    # payload_info of the sequenced payload in the block, and (sequence number, pokemon index) of its eggs,
+    # duplicates included, or None and [] if there isn't one
+    # only numbers up to the header's egg count, with the header's key, belong to it
+    found = find_sequenced_eggs(block)
+    for number, header_index, frame in found:
+        if number != 0 or not sequence_frame_ok(frame):
+            continue
+        info = parse_payload_header(frame)
+        if info is not None and info.version == 4:
+            break
+    else:
+        return None, []
+    key = sequence_key(frame)
+    egg_count = math.ceil(info.stored_length/sequence_chunk_size)
+    eggs = [(0, header_index)]
+    eggs.extend((number, pokemon_index) for number, pokemon_index, frame in found if 0 < number <= egg_count and sequence_frame_ok(frame, key))
+    return info, eggs
+
+def read_sequenced_header(block):
+    # payload_info with slots, the pokemon index of each egg by sequence number, None for a missing egg
+    info, eggs = find_sequenced_payload(block)
+    if info is None:
+        return None
+    slots = {}
+    for number, pokemon_index in eggs:
+        slots.setdefault(number, pokemon_index)
+    return info._replace(slots=[slots.get(number) for number in range(math.ceil(info.stored_length/sequence_chunk_size) + 1)])
+
+def payload_slots(block):
+    # pokemon indexes of every egg of the payload stored in the block, with its header
+    # an empty set when it wasn't stored with a header
+    info = read_payload_header(block)
+    if info is None:
+        return set()
+    if info.slots is not None:
+        return sequenced_slots(block)
+    if info.parity:
+        frames = math.ceil(info.stored_length/parity_chunk_size)
+        eggs = frames + math.ceil(frames/info.parity)
+    else:
+        eggs = math.ceil(info.stored_length/bytes_per_poke)
+    last = len(block.pokemon_list) - 1
+    return set(range(last, max(-1, last - 1 - eggs), -1))
+
+def legacy_slots(block):
+    # pokemon indexes of the eggs that could be data stored without a header, which has no length,
+    # so every egg backwards from the last cell up to the first cell that isn't one
+    # an empty set when there is a header
+    if read_payload_header(block) is not None:
+        return set()
+    egg_slots = set(block.egg_slots())
+    slots = set()
+    pokemon_index = len(block.pokemon_list) - 1
+    while pokemon_index in egg_slots:
+        slots.add(pokemon_index)
+        pokemon_index -= 1
+    return slots
+
+def sequenced_slots(block):
+    # pokemon indexes of every egg of the sequenced payload stored in the block, duplicates of its eggs too
+    # an empty set when there isn't one
+    return {pokemon_index for number, pokemon_index in find_sequenced_payload(block)[1]}
+
+def clear_eggs(block, slots):
+    # clears the pokemon at the pokemon indexes in slots, like the eggs of a payload stored before
+    # that what was just stored didn't overwrite
+    for pokemon_index in sorted(slots):
+        block.pokemon_list[pokemon_index].clear()
+        block.update_occupancy(pokemon_index)
+
+def choose_slots(free_slots, count, boxes=None, layout='contiguous'):
+    # picks count of free_slots (pokemon indexes), only from boxes (1-14) if given
+    # contiguous takes them backwards from the end, the same cells storing has always used
+    # scattered spreads them out evenly over the free cells
+    candidates = sorted((i for i in free_slots if boxes is None or i // 30 + 1 in boxes), reverse=True)
+    if count > len(candidates):
+        raise ValueError(f'Not enough room to write this data! It needs {count} eggs, there are {len(candidates)} cells to use')
+    if layout == 'scattered':
+        return [candidates[k * len(candidates) // count] for k in range(count)]
+    return candidates[0:count]
+
+def hide_placed(block, data_pieces, compression='none', level=None, digest_kind='crc32', delta=False, empty_only=True, boxes=None, layout='contiguous'):
+    # like hide_payload, but in sequenced eggs in the cells a placement picks, see choose_slots
+    # with empty_only only empty cells are used, and the eggs of the payload stored before, which this replaces
+    # its eggs that aren't reused are cleared
+    # the data is compressed into memory first, to know how many eggs it needs, it can't be more than the boxes hold anyway
+    # returns a dict of how much was stored, and the slots used, by sequence number
+    if layout not in layouts:
+        raise ValueError(f'Unknown layout: {layout}')
+    capacity = (len(block.pokemon_list) - 1) * sequence_chunk_size
+    compressor = make_compressor(compression, level)
+    digest = make_digest(digest_kind)
+    stored = bytearray()
+    original_length = 0
+    for data in data_pieces:
+        original_length += len(data)
+        digest.update(data)
+        stored.extend(compressor.compress(data))
+        if len(stored) > capacity:
+            raise ValueError('Not enough room to write this data!')
+    stored.extend(compressor.flush())
+
+    header = payload_header.pack(payload_magic, 4, compressions.index(compression), 0xFF if level is None else level, original_length, len(stored))
+    header += payload_digest.pack(digests.index(digest_kind), digest.digest())
+    frames = [make_sequence_frame(header, 0)]
+    key = sequence_key(frames[0])
+    for number, i in enumerate(range(0, len(stored), sequence_chunk_size), 1):
+        frames.append(make_sequence_frame(stored[i:i+sequence_chunk_size], number, key))
+
+    old_slots = payload_slots(block)
+    free_slots = set(block.empty_slots()) | old_slots if empty_only else range(len(block.pokemon_list))
+    slots = choose_slots(free_slots, len(frames), boxes, layout)
+    eggs_written = 0
+    for pokemon_index, frame in zip(slots, frames):
+        eggs_written += write_chunk(block, pokemon_index, frame, delta)
+    clear_eggs(block, old_slots - set(slots))
+    return {
+        'compression': compression,
+        'digest': digest_kind,
+        'original_length': original_length,
+        'stored_length': len(stored),
+        'eggs': len(frames),
+        'eggs_written': eggs_written,
+        'bytes_per_egg': original_length / len(frames),
+        'slots': slots,
+    }
+
+def read_payload_header(block):
+    # returns a payload_info, or None if the data wasn't stored with a header
+    # the header is in the last cell in box 14, or for sequenced eggs in egg 0, wherever that is
+    first = block.pokemon_list[-1]
+    if not first.is_clear() and first.egg:
+        info = parse_payload_header(first.extract_secret_data())
+        if info is not None and info.version != 4:
+            return info
+    return read_sequenced_header(block)
+
+def iter_stored_chunks(block, info, repairs=None):
+    # yields the stored (compressed) data egg by egg, from the egg after the header
+    # with parity, a damaged egg is rebuilt from its group, and (pokemon index, egg data) of every egg
+    # that needs rewriting, damaged data and parity eggs, is added to repairs if it's given
+    if info.slots is not None:
+        for number, pokemon_index in enumerate(info.slots[1:], 1):
+            if pokemon_index is None:
+                raise ValueError(f'Egg {number} of the stored data is missing!')
+            yield block.pokemon_list[pokemon_index].extract_secret_data()[0:sequence_chunk_size]
+        return
+
+    pokemon_index = len(block.pokemon_list) - 2
+    if not info.parity:
+        for _ in range(math.ceil(info.stored_length/bytes_per_poke)):
+            if pokemon_index < 0:
+                raise ValueError('Stored data is longer than the boxes!')
+            yield block.pokemon_list[pokemon_index].extract_secret_data()
+            pokemon_index -= 1
+        return
+
+    frame_count = math.ceil(info.stored_length/parity_chunk_size)
+    number = 0
+    while number < frame_count:
+        group_size = min(info.parity, frame_count - number)
+        if pokemon_index - group_size < 0:
+            raise ValueError('Stored data is longer than the boxes!')
+        # the group's data eggs, then its parity egg
+        frames = [bytes(block.pokemon_list[pokemon_index - i].extract_secret_data()) for i in range(group_size + 1)]
+        damaged = [i for i in range(group_size) if not parity_frame_ok(frames[i], number + i)]
+        if len(damaged) > 1:
+            raise ValueError(f'{len(damaged)} eggs in one parity group are damaged, only one can be repaired')
+        if damaged:
+            i = damaged[0]
+            frames[i] = xor_frames(frames[0:i] + frames[i+1:])
+            if not parity_frame_ok(frames[i], number + i):
+                raise ValueError('Damaged egg could not be repaired, its parity egg is damaged too')
+            if repairs is not None:
+                repairs.append((pokemon_index - i, frames[i]))
+        elif repairs is not None:
+            parity_frame = xor_frames(frames[0:group_size])
+            if parity_frame != frames[group_size]:
+                repairs.append((pokemon_index - group_size, parity_frame))
+        for frame in frames[0:group_size]:
+            yield frame[0:parity_chunk_size]
+        pokemon_index -= group_size + 1
+        number += group_size
+
+def iter_payload(block, info, repairs=None):
+    # yields the original data piece by piece, reading only the eggs the payload was stored in
+    # the length and digest are checked once everything has been read, a ValueError if they don't match
+    # repairs, see iter_stored_chunks
+    decompressor = make_decompressor(info.compression)
+    digest = make_digest(info.digest_kind) if info.digest_kind else None
+    remaining = info.stored_length
+    original_length = 0
+    for chunk in iter_stored_chunks(block, info, repairs):
+        chunk = chunk[0:remaining]
+        remaining -= len(chunk)
+        data = decompress(decompressor.decompress, bytes(chunk))
+        if digest:
+            digest.update(data)
+        original_length += len(data)
+        yield data
+    if hasattr(decompressor, 'flush'):
+        data = decompress(decompressor.flush)
+        if digest:
+            digest.update(data)
+        original_length += len(data)
+        yield data
+    if original_length != info.original_length:
+        raise ValueError('Extracted data is not the length it was stored with!')
+    if digest and digest.digest() != info.digest:
+        raise ValueError('Extracted data does not match its digest!')
+
+def decompress(method, *args):
+    # each compression module has its own error, make them all a ValueError
+    try:
+        return method(*args)
+    except Exception as e:
+        raise ValueError(f'Stored data could not be decompressed: {e}')
+
+def check_payload(block, repairs=None):
+    # checks data stored with a header against its own length and digest, no copy of the original needed
+    # returns None if there is no header
+    # with parity, damaged eggs that could be rebuilt still pass, give repairs (see iter_stored_chunks) to find out about them
+    info = read_payload_header(block)
+    if info is None:
+        return None
+    try:
+        for data in iter_payload(block, info, repairs):
+            pass
+    except ValueError:
+        return False
+    return True
+
+def repair_payload(block):
+    # rewrites the damaged eggs of data stored with parity eggs, see iter_stored_chunks
+    # returns how many eggs were rewritten, None if there is no header
+    # a ValueError if the data can't be repaired
+    info = read_payload_header(block)
+    if info is None:
+        return None
+    repairs = []
+    for data in iter_payload(block, info, repairs):
+        pass
+    for pokemon_index, frame in repairs:
+        write_chunk(block, pokemon_index, frame)
+    return len(repairs)
+
+def extract_secret_data(block):
+    # data stored with a header comes back exactly as it was stored, decompressed
+    info = read_payload_header(block)
+    if info is not None:
+        return bytearray(b''.join(iter_payload(block, info)))
+
+    pokemon_index = len(block.pokemon_list) - 1
+    if not block.pokemon_list[pokemon_index].egg:
+        raise ValueError('Last pokemon in last box is not an egg.')
+
+    extracted_data = bytearray()
+    while pokemon_index >= 0 and block.pokemon_list[pokemon_index].egg:
+        temp = block.pokemon_list[pokemon_index].extract_secret_data()
+        extracted_data.extend(temp)
+        pokemon_index -= 1
+    return extracted_data
+
+def verify_secret_data(block, secret_data):
+    info = read_payload_header(block)
+    if info is not None:
+        # the file can be compared with the header before decoding any eggs
+        if len(secret_data) != info.original_length:
+            return False
+        if info.digest_kind:
+            digest = make_digest(info.digest_kind)
+            digest.update(secret_data)
+            if digest.digest() != info.digest:
+                return False
+            return check_payload(block)
+        try:
+            return extract_secret_data(block) == secret_data
+        except ValueError:
+            return False
+
+    needed_pokemon = math.ceil(len(secret_data)/bytes_per_poke)
+    if needed_pokemon > len(block.pokemon_list):
+        raise ValueError('Not enough room to write this data!')
+
+    # start with last pokemon in last box, work backwards
+    pokemon_index = len(block.pokemon_list) - 1
+    # flag to store if data is validated OK
+    status = True
+    for i in range(0, len(secret_data), bytes_per_poke):
+        chunk = secret_data[i:i+bytes_per_poke]
+        if len(chunk) < bytes_per_poke:
+            # padding with 0s, if the final pokemon/chunk needs it
+            chunk.extend([0] * (bytes_per_poke - len(chunk)))
+
+        # make sure we can read back the same data
+        check_chunk = block.pokemon_list[pokemon_index].extract_secret_data()
+        for x in range(bytes_per_poke):
+            if chunk[x] != check_chunk[x]:
+                status = False
+                # add a debug option that prints this
+                # box = (pokemon_index//30) + 1
+                # cell = (pokemon_index % 30) + 1
+                # print(f'Incorrect Chunk {x} for Pokemon@ Box:{box} Cell:{cell}')
+                # print(f'Expected: {chunk[x]:08b}')
+                # print(f'Found   : {check_chunk[x]:08b}')
+        pokemon_index -= 1
+
+    return status
+
+def string_to_names(block, input_string):
+    # the run has to mark its own end, or names_to_string would carry on into the next pokemon's name if it looks like Base64
+    # a short last name or a '=' does, a text filling its last name exactly without a '=' gets one more name of just '='
+    # (a '=' with no padding needed decodes to nothing), a text filling every name has no next name to worry about
+    if len(input_string) % name_length == 0 and '=' not in input_string and len(input_string) < 4200:
+        input_string += '='
+
+    # if we don't have enough pokemon to rename for this text, error
+    if len(input_string) > 4200:
+        raise ValueError('Input string is too long!')
+
+    # the whole string is encoded at once, then handed out 10 bytes per pokemon
+    name_bytes = encode_names(input_string)
+    for pokemon_index, i in enumerate(range(0, len(name_bytes), name_length)):
+        this_pokemon = block.pokemon_list[pokemon_index]
+        was_clear = this_pokemon.is_clear()
+        if was_clear:
+            this_pokemon.national_dex_id = 1
+        this_pokemon.name_bytes = name_bytes[i:i+name_length]
+        if was_clear:
+            block.update_occupancy(pokemon_index)
+
+def names_to_string(block):
+    # the reverse of string_to_names, reads names from the first cell in box 1 onwards
+    # the run ends at the first name that isn't a full 10 Base64 characters (a shorter last name is part of it),
+    # or at a '=', see string_to_names
+    # only the names are read, so no pokemon is decrypted
+    text_parts = []
+    for name in block.names():
+        if not name or name.strip(text_chars):
+            break
+        text_parts.append(name)
+        if len(name) < name_length:
+            break
+    text = ''.join(text_parts)
+    # a pokemon with a Base64 looking name can follow the run, Base64 comes in groups of 4 characters
+    if '=' in text:
+        return text[0:text.index('=')] + '=' * (-text.index('=') % 4)
+    return text[0:len(text) - len(text) % 4]
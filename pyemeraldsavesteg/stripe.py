@@ -0,0 +1,117 @@
+# striping, for data too big for one save (more than 28,140 bytes)
+# the data is split over several saves, each stripe is stored and extracted in its own worker process
+#
+#   PyEmeraldSaveSteg.py stripe store <payload_path> <save_path> [<save_path> ...]
+#   PyEmeraldSaveSteg.py stripe extract <output_path> <save_path> [<save_path> ...]
+#
+# every stripe starts with a header, so the saves can be given to extract in any order:
+#   4 bytes  magic, b'PESS'
+#   2 bytes  stripe number, starting at 0
+#   2 bytes  number of stripes
+#   4 bytes  length of the whole payload
+#   4 bytes  length of the data in this stripe
+#   4 bytes  crc32 of the whole payload, to make sure all stripes are from the same payload
+
+import argparse
+import binascii
+import math
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+
+from . import actions
+
+stripe_magic = b'PESS'
+stripe_header = struct.Struct('<4sHHIII')
+# 420 eggs * 67 bytes, less the header
+stripe_capacity = 420 * 67 - stripe_header.size
+
+
+def split_stripes(payload, count):
+    # returns count stripes, each one header + part of the payload
+    stripe_length = math.ceil(len(payload) / count)
+    if stripe_length > stripe_capacity:
+        raise ValueError(f'Not enough room to write this data! {count} saves hold at most {count * stripe_capacity} bytes')
+    payload_crc = binascii.crc32(payload)
+    stripes = []
+    for i in range(count):
+        part = payload[i*stripe_length : (i+1)*stripe_length]
+        header = stripe_header.pack(stripe_magic, i, count, len(payload), len(part), payload_crc)
+        stripes.append(header + part)
+    return stripes
+
+
+def join_stripes(stripes):
+    # stripes can be in any order, and can have padding after the data (from the final egg)
+    parts = {}
+    payload_info = None
+    for stripe in stripes:
+        magic, index, count, payload_length, part_length, payload_crc = stripe_header.unpack_from(stripe)
+        if magic != stripe_magic:
+            raise ValueError('Save does not contain a stripe!')
+        if payload_info is None:
+            payload_info = (count, payload_length, payload_crc)
+        elif payload_info != (count, payload_length, payload_crc):
+            raise ValueError('Stripes are from different payloads!')
+        parts[index] = stripe[stripe_header.size : stripe_header.size+part_length]
+
+    count, payload_length, payload_crc = payload_info
+    missing = [i for i in range(count) if i not in parts]
+    if missing:
+        raise ValueError(f'Missing stripes: {missing}')
+    payload = b''.join(parts[i] for i in range(count))
+    if len(payload) != payload_length or binascii.crc32(payload) != payload_crc:
+        raise ValueError('Striped data is corrupt!')
+    return payload
+
+
+def check_save_paths(save_paths):
+    # each stripe needs its own save, the same file twice would have one stripe written over the other
+    seen = {}
+    for save_path in save_paths:
+        real_path = os.path.realpath(save_path)
+        if real_path in seen:
+            raise ValueError(f'{save_path} is the same save as {seen[real_path]}')
+        seen[real_path] = save_path
+
+
+def store_striped(payload, save_paths, workers=None, use_backup_save=False):
+    check_save_paths(save_paths)
+    stripes = split_stripes(payload, len(save_paths))
+    with ProcessPoolExecutor(max_workers=workers or min(len(save_paths), os.cpu_count() or 1)) as executor:
+        list(executor.map(actions.store_data, save_paths, stripes, [use_backup_save] * len(save_paths)))
+
+
+def extract_striped(save_paths, workers=None, use_backup_save=False):
+    check_save_paths(save_paths)
+    with ProcessPoolExecutor(max_workers=workers or min(len(save_paths), os.cpu_count() or 1)) as executor:
+        stripes = list(executor.map(actions.extract_data, save_paths, [use_backup_save] * len(save_paths)))
+    return join_stripes(stripes)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='PyEmeraldSaveSteg.py stripe')
+    parser.add_argument('operation', choices=('store', 'extract'))
+    parser.add_argument('payload_path', help='File to store, or file to extract to')
+    parser.add_argument('save_paths', nargs='+', help='Saves to split the data over, for extract they can be in any order')
+    parser.add_argument('--workers', '-w', type=int, help='Number of worker processes, defaults to one per save (up to the number of CPUs)')
+    parser.add_argument('--use-backup-save', '-b', help='Use the backup save (not the current save)', action='store_true')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        check_save_paths(args.save_paths)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.operation == 'store':
+        with open(args.payload_path, 'rb') as fh:
+            payload = fh.read()
+        store_striped(payload, args.save_paths, args.workers, args.use_backup_save)
+    else:
+        payload = extract_striped(args.save_paths, args.workers, args.use_backup_save)
+        with open(args.payload_path, 'wb') as fh:
+            fh.write(payload)